@@ -1,277 +1,77 @@
 import streamlit as st
-import os
-from dataclasses import dataclass
-from typing import List, Optional
 import datetime
+from html import escape
+from typing import Optional
+
+from content import Project
+from inference import inference_service
+from memprofile import MemoryProfiler
+from tenants import Portfolio, TenantRegistry, default_portfolio, resolve_tenant
+from timeline import DateRange, TimelineIndex
+from warmstart import WarmState, load_state, safe_url
 
 # ============================================================================
 # PAGE CONFIGURATION
 # ============================================================================
-st.set_page_config(
-    page_title="Sunny Solomon — Portfolio",
-    page_icon="🌙",
-    layout="centered",
-    initial_sidebar_state="collapsed",
-)
+def configure_page(title: str):
+    st.set_page_config(
+        page_title=title,
+        page_icon="🌙",
+        layout="centered",
+        initial_sidebar_state="collapsed",
+    )
+
+PROJECTS_PER_PAGE = 6
 
 # ============================================================================
-# DATA MODELS
+# DERIVED STATE
 # ============================================================================
-@dataclass
-class Project:
-    title: str
-    subtitle: str
-    description: str
-    deliverables: List[str]
-    tools: List[str]
-    links: dict
-    tags: List[str]
-    image: Optional[str] = None
+@st.cache_resource(show_spinner=False)
+def warm_state() -> WarmState:
+    """Precompiled state from build/warmstart.pkl, rebuilt if stale or missing"""
+    return load_state()
+
+@st.cache_resource(show_spinner=False)
+def tenant_registry() -> TenantRegistry:
+    """Process-wide portfolio registry shared by every session"""
+    return TenantRegistry(default_portfolio(warm_state()))
+
+def current_portfolio() -> Portfolio:
+    """Portfolio for this request, chosen by ?tenant= or the Host header"""
+    tenant = resolve_tenant(st.query_params, st.context.headers)
+    return tenant_registry().get(tenant)
 
 # ============================================================================
 # STYLING
 # ============================================================================
 def load_css():
-    st.markdown("""
-    <style>
-    /* ========== Base Styles ========== */
-    .stApp {
-        background: radial-gradient(circle at 10% 20%, #071226 0%, #05050a 40%, #030305 100%);
-        color: #e6eef8;
-        font-family: "Inter", -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-    }
-
-    .main > div {
-        max-width: 980px;
-        margin: 0 auto;
-        padding: 20px;
-    }
-
-    /* ========== Navigation ========== */
-    div[data-testid="column"] button {
-        width: 100%;
-        border-radius: 999px;
-        font-weight: 600;
-        transition: all 0.18s ease;
-        border: 1px solid rgba(60,130,255,0.12);
-        background: transparent;
-        color: #dff0ff;
-    }
-
-    div[data-testid="column"] button:hover {
-        transform: translateY(-2px);
-        background: linear-gradient(90deg, rgba(10,32,86,0.6), rgba(8,16,40,0.4));
-        box-shadow: 0 10px 30px rgba(15,55,140,0.25);
-        border-color: rgba(60,150,255,0.26);
-    }
-
-    /* ========== Cards ========== */
-    .card {
-        background: linear-gradient(180deg, rgba(9,18,34,0.55), rgba(6,10,20,0.44));
-        border-radius: 12px;
-        padding: 24px;
-        border: 1px solid rgba(255,255,255,0.03);
-        margin-bottom: 16px;
-        box-shadow: 0 6px 20px rgba(2,8,20,0.6);
-        transition: transform 0.2s ease, box-shadow 0.2s ease;
-    }
-
-    .card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(10, 40, 100, 0.4);
-    }
-
-    /* ========== Hero Section ========== */
-    .hero-container {
-        display: flex;
-        gap: 32px;
-        align-items: center;
-        margin-bottom: 32px;
-        padding: 24px;
-        background: linear-gradient(180deg, rgba(9,18,34,0.55), rgba(6,10,20,0.44));
-        border-radius: 16px;
-        border: 1px solid rgba(255,255,255,0.03);
-    }
-
-    .hero-image {
-        width: 180px;
-        height: 180px;
-        border-radius: 16px;
-        overflow: hidden;
-        box-shadow: 0 12px 40px rgba(10,30,80,0.6);
-        border: 2px solid rgba(190,227,255,0.2);
-        animation: floaty 6s ease-in-out infinite;
-        flex-shrink: 0;
-    }
-
-    @keyframes floaty {
-        0%, 100% { transform: translateY(0px); }
-        50% { transform: translateY(-8px); }
-    }
-
-    .hero-title {
-        font-size: 32px;
-        font-weight: 800;
-        color: #e7f5ff;
-        margin-bottom: 8px;
-    }
-
-    .hero-subtitle {
-        font-size: 16px;
-        color: #bcd9ff;
-        margin-bottom: 16px;
-    }
-
-    .hero-description {
-        color: #a9cbe8;
-        line-height: 1.6;
-        margin-bottom: 20px;
-    }
-
-    /* ========== Buttons ========== */
-    .action-btn {
-        display: inline-block;
-        background: linear-gradient(90deg, #0b5cff, #2ea0ff);
-        color: white;
-        padding: 10px 20px;
-        border-radius: 999px;
-        text-decoration: none;
-        font-weight: 700;
-        margin-right: 10px;
-        margin-top: 8px;
-        transition: all 0.2s ease;
-    }
-
-    .action-btn:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(11,92,255,0.4);
-        text-decoration: none;
-        color: white;
-    }
-
-    /* ========== Project Tags ========== */
-    .project-tag {
-        background: rgba(11,92,255,0.2);
-        color: #5db4ff;
-        padding: 6px 12px;
-        border-radius: 12px;
-        font-size: 12px;
-        margin-right: 8px;
-        margin-bottom: 8px;
-        display: inline-block;
-        border: 1px solid rgba(11,92,255,0.3);
-    }
-
-    /* ========== Tech Stack ========== */
-    .tech-item {
-        background: rgba(60,130,255,0.15);
-        padding: 12px;
-        border-radius: 8px;
-        text-align: center;
-        margin: 4px;
-        border: 1px solid rgba(60,130,255,0.2);
-        transition: all 0.2s ease;
-    }
-
-    .tech-item:hover {
-        background: rgba(60,130,255,0.25);
-        transform: translateY(-2px);
-    }
-
-    /* ========== Info Cards ========== */
-    .info-card {
-        background: linear-gradient(135deg, rgba(11,92,255,0.1), rgba(46,160,255,0.05));
-        padding: 20px;
-        border-radius: 12px;
-        border: 1px solid rgba(60,130,255,0.2);
-        text-align: center;
-    }
-
-    .info-card strong {
-        color: #5db4ff;
-        font-size: 14px;
-        display: block;
-        margin-bottom: 8px;
-    }
-
-    .info-card-content {
-        color: #bcdcff;
-        font-size: 15px;
-    }
-
-    /* ========== Expander Styling ========== */
-    .streamlit-expanderHeader {
-        background: linear-gradient(90deg, rgba(11,92,255,0.1), rgba(46,160,255,0.05));
-        border-radius: 8px;
-        border: 1px solid rgba(60,130,255,0.2);
-        font-weight: 600;
-        color: #e7f5ff;
-    }
-
-    /* ========== Section Headers ========== */
-    h1, h2, h3 {
-        color: #e7f5ff;
-    }
-
-    /* ========== Mobile Responsive ========== */
-    @media (max-width: 768px) {
-        .hero-container {
-            flex-direction: column;
-            text-align: center;
-        }
-
-        .hero-image {
-            width: 140px;
-            height: 140px;
-        }
-
-        .hero-title {
-            font-size: 24px;
-        }
-
-        .hero-subtitle {
-            font-size: 14px;
-        }
-
-        div[data-testid="column"] {
-            min-width: 100% !important;
-        }
-    }
-
-    /* ========== Animations ========== */
-    .fade-in {
-        animation: fadeUp 0.85s ease both;
-    }
-
-    @keyframes fadeUp {
-        from {
-            opacity: 0;
-            transform: translateY(20px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-
-    /* ========== Hide Streamlit Branding ========== */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(warm_state().css, unsafe_allow_html=True)
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
-@st.cache_data
-def local_asset(path, fallback="https://via.placeholder.com/400x400.png?text=Profile"):
-    """Check if local asset exists, return fallback if not"""
-    return path if os.path.exists(path) else fallback
+def local_asset(portfolio: Portfolio, path, fallback="https://via.placeholder.com/400x400.png?text=Profile"):
+    """Return the fingerprinted static URL for a portfolio's asset, or fallback if missing"""
+    return portfolio.asset_url(path, fallback)
 
 # ============================================================================
 # COMPONENT FUNCTIONS
 # ============================================================================
+def render_period_filter(index: TimelineIndex, key: str):
+    """Render a year-range slider and return matching entries, most recent first"""
+    span = index.span
+    if span is None or span.start.year == span.end.year:
+        return index.chronological(reverse=True)
+    
+    years = list(range(span.start.year, span.end.year + 1))
+    start, end = st.select_slider(
+        "Years", options=years, value=(years[0], years[-1]), key=f"period_{key}"
+    )
+    if (start, end) == (years[0], years[-1]):
+        return index.chronological(reverse=True)
+    query = DateRange(datetime.date(start, 1, 1), datetime.date(end, 12, 31))
+    return index.overlapping(query)[::-1]
+
 def render_navigation():
     """Render navigation bar"""
     st.markdown("<div style='margin-bottom: 20px;'>", unsafe_allow_html=True)
@@ -297,58 +97,91 @@ def render_navigation():
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def render_project_card(project: Project, expanded: bool = False):
-    """Render an individual project card"""
-    with st.expander(f"🚀 {project.title}", expanded=expanded):
-        st.markdown(f"**{project.subtitle}**")
-        
-        # Tags
-        if project.tags:
-            tags_html = "".join([f'<span class="project-tag">{tag}</span>' for tag in project.tags])
-            st.markdown(tags_html, unsafe_allow_html=True)
-        
-        st.write(project.description)
-        
-        # Deliverables
-        if project.deliverables:
-            st.markdown("**📦 Key Deliverables**")
-            for item in project.deliverables:
-                st.markdown(f"- {item}")
-        
-        # Tools
-        if project.tools:
-            st.markdown("**🛠️ Tech Stack**")
-            tool_cols = st.columns(min(4, len(project.tools)))
-            for idx, tool in enumerate(project.tools):
-                with tool_cols[idx % len(tool_cols)]:
-                    st.markdown(f'<div class="tech-item">{tool}</div>', unsafe_allow_html=True)
-        
-        # Links
-        if project.links:
-            st.markdown("**🔗 Links**")
-            link_html = "".join([
-                f'<a href="{url}" target="_blank" class="action-btn">{label}</a>'
-                for label, url in project.links.items()
-            ])
-            st.markdown(link_html, unsafe_allow_html=True)
+@st.fragment
+def render_project_card(portfolio: Portfolio, idx: int, project: Project, expanded: bool = False):
+    """Render a project card; the body is only built while the card is open.
+    
+    Runs as a fragment, so opening or closing a card reruns just this card.
+    Keyed by the project's position, since titles need not be unique.
+    """
+    key = f"project_open_{portfolio.tenant}_{idx}"
+    if key not in st.session_state:
+        st.session_state[key] = expanded
+    
+    with st.container(border=True):
+        if st.toggle(f"🚀 {project.title}", key=key):
+            render_project_body(portfolio, idx, project)
+
+def render_project_body(portfolio: Portfolio, idx: int, project: Project):
+    """Render the contents of an open project card"""
+    fragments = portfolio.project_fragments(idx, project)
+    st.markdown(f"**{project.subtitle}**")
+    
+    # Tags
+    if project.tags:
+        st.markdown(fragments.tags, unsafe_allow_html=True)
+    
+    st.write(project.description)
+    
+    # Deliverables
+    if project.deliverables:
+        st.markdown("**📦 Key Deliverables**")
+        for item in project.deliverables:
+            st.markdown(f"- {item}")
+    
+    # Tools
+    if project.tools:
+        st.markdown("**🛠️ Tech Stack**")
+        tool_cols = st.columns(min(4, len(project.tools)))
+        for col_idx, tool_html in enumerate(fragments.tools):
+            with tool_cols[col_idx % len(tool_cols)]:
+                st.markdown(tool_html, unsafe_allow_html=True)
+    
+    # Links
+    if project.links:
+        st.markdown("**🔗 Links**")
+        st.markdown(fragments.links, unsafe_allow_html=True)
+
+def render_pager(total: int, per_page: int, key: str) -> int:
+    """Render previous/next controls and return the current page index"""
+    pages = max(1, -(-total // per_page))
+    page = min(st.session_state.get(key, 0), pages - 1)
+    st.session_state[key] = page
+    if pages == 1:
+        return page
+    
+    def go(step: int):
+        st.session_state[key] = min(max(st.session_state[key] + step, 0), pages - 1)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("◀ Previous", key=f"{key}_prev", on_click=go, args=(-1,),
+                  disabled=page == 0, use_container_width=True)
+    with col2:
+        st.markdown(f"<div style='text-align:center;padding-top:8px;'>Page {page + 1} of {pages}</div>",
+                    unsafe_allow_html=True)
+    with col3:
+        st.button("Next ▶", key=f"{key}_next", on_click=go, args=(1,),
+                  disabled=page == pages - 1, use_container_width=True)
+    return page
 
 # ============================================================================
 # PAGE CONTENT
 # ============================================================================
-def render_home():
+def render_home(portfolio: Portfolio):
     """Home page content"""
+    profile = portfolio.profile
     st.markdown('<div class="fade-in">', unsafe_allow_html=True)
     
     # Hero Section
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.markdown("""
-        <div class="hero-title">Hey — I'm <span style="color:#BEE3FF">Sunny Solomon</span> 👋</div>
-        <div class="hero-subtitle">Data Science · UI/UX · Music</div>
+        st.markdown(f"""
+        <div class="hero-title">Hey — I'm <span style="color:#BEE3FF">{escape(profile['name'])}</span> 👋</div>
+        <div class="hero-subtitle">{escape(profile['headline'])}</div>
         <div class="hero-description">
-        I build interpretable ML models and user-centered experiences. Welcome to my interactive 
-        portfolio where you can explore my projects, skills, and professional journey.
+        {escape(profile['intro'])}
         </div>
         """, unsafe_allow_html=True)
         
@@ -358,7 +191,7 @@ def render_home():
         """, unsafe_allow_html=True)
     
     with col2:
-        profile_path = local_asset("assets/profile.jpg")
+        profile_path = escape(local_asset(portfolio, profile["photo"]))
         st.markdown(f'<div class="hero-image"><img src="{profile_path}" style="width:100%;height:100%;object-fit:cover;"></div>', unsafe_allow_html=True)
     
     st.markdown("</div>", unsafe_allow_html=True)
@@ -368,217 +201,106 @@ def render_home():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown("""
+        st.markdown(f"""
         <div class="info-card">
             <strong>Current Focus</strong>
-            <div class="info-card-content">Interpretable ML<br>Survival Analysis<br>Data Viz</div>
+            <div class="info-card-content">{"<br>".join(escape(item) for item in profile['focus'])}</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
+        st.markdown(f"""
         <div class="info-card">
             <strong>Location</strong>
-            <div class="info-card-content">Hyderabad, India</div>
+            <div class="info-card-content">{escape(profile['location'])}</div>
         </div>
         """, unsafe_allow_html=True)
     
     with col3:
-        st.markdown("""
+        st.markdown(f"""
         <div class="info-card">
             <strong>Contact</strong>
-            <div class="info-card-content">sunnysolomon20<br>@gmail.com</div>
+            <div class="info-card-content">{escape(profile['email']).replace("@", "<br>@")}</div>
         </div>
         """, unsafe_allow_html=True)
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def render_about():
+def render_about(portfolio: Portfolio):
     """About page content"""
+    profile = portfolio.profile
     st.markdown('<div class="card fade-in">', unsafe_allow_html=True)
-    st.header("About — Sunny Solomon")
+    st.header(f"About — {profile['name']}")
     
-    st.write("""
-I'm Sunny Solomon — a Data Science and UI/UX enthusiast from Hyderabad, India.
-
-With a background in Life Sciences and a growing passion for AI, Machine Learning, and Data Visualization, 
-I'm focused on transforming complex data into clear, actionable insights that drive impact.
-
-I enjoy blending analytical thinking with creativity, designing meaningful interfaces, and building 
-intelligent, user-centered solutions. Currently, I'm expanding my skills in machine learning, generative 
-AI, and forecasting analytics, while continuously exploring ways to make data more human and intuitive.
-
-**Outside of work:**  
-I'm a musician at heart — a guitarist, keyboard player, and singer who finds rhythm in every detail. 
-I also love football, gaming, and working out, which keep me motivated and balanced.
-
-**My goal:**  
-To keep learning, innovating, and creating — whether through data, design, or music.
-""")
+    st.write(profile["about"])
     
     st.markdown("---")
     st.markdown("**Quick Facts**")
     
+    facts = profile["quick_facts"]
+    half = (len(facts) + 1) // 2
     col1, col2 = st.columns(2)
     with col1:
-        st.write("🎓 B.Sc. Biotechnology, Genetics & Chemistry")
-        st.write("📍 Hyderabad, Telangana, India")
-        st.write("🎂 Born April 26, 2002")
+        for fact in facts[:half]:
+            st.write(fact)
     
     with col2:
-        st.write("🎸 Musician (Guitar, Keyboard, Vocals)")
-        st.write("⚽ Football Enthusiast")
-        st.write("🎮 Gamer & Fitness Buff")
+        for fact in facts[half:]:
+            st.write(fact)
     
     # Resume Download
-    if os.path.exists("assets/Sunny_Solomon_Resume.pdf"):
-        with open("assets/Sunny_Solomon_Resume.pdf", "rb") as f:
-            st.download_button(
-                "📄 Download Resume",
-                f,
-                file_name="Sunny_Solomon_Resume.pdf",
-                mime="application/pdf",
-                use_container_width=True
-            )
+    resume_url = local_asset(portfolio, profile["resume"], fallback=None)
+    if resume_url:
+        file_name = profile["resume"].rsplit("/", 1)[-1]
+        st.markdown(
+            f'<a href="{escape(resume_url)}" download="{escape(file_name)}" class="action-btn" '
+            f'style="display:block;text-align:center;">📄 Download Resume</a>',
+            unsafe_allow_html=True,
+        )
     else:
         st.info("📄 Resume available upon request")
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def render_projects():
+def render_projects(portfolio: Portfolio):
     """Projects page content"""
     st.markdown('<div class="fade-in">', unsafe_allow_html=True)
     st.header("Projects & Case Studies")
     st.write("Explore my featured work across data science, machine learning, and UI/UX design.")
     
-    projects = [
-        Project(
-            title="Breast Cancer Risk Prediction",
-            subtitle="Survival Analysis & Machine Learning",
-            description="""
-            A comprehensive predictive model estimating 10-year mortality risk for breast cancer patients 
-            using clinical and demographic data. This project combines survival analysis techniques 
-            (Kaplan-Meier, Cox PH) with modern machine learning algorithms to enhance prediction accuracy.
-            """,
-            deliverables=[
-                "Data preprocessing & feature engineering pipeline",
-                "Survival curves & hazard visualization (Kaplan-Meier plots)",
-                "Comparative analysis of statistical vs. ML approaches",
-                "Interactive risk prediction interface with patient input"
-            ],
-            tools=["Python", "Pandas", "NumPy", "scikit-learn", "XGBoost", "lifelines", "Matplotlib"],
-            links={
-                "GitHub": "https://github.com/Sunny777Solomon/Breast-cancer-Risk-Prediction-streamlit",
-                "Live Demo": "#demo"
-            },
-            tags=["Healthcare", "Machine Learning", "Survival Analysis", "Python", "Data Science"]
-        ),
-        Project(
-            title="Solo Leveling — Habit Tracker",
-            subtitle="UI/UX Design & Gamification",
-            description="""
-            A dark-themed habit tracker application concept inspired by RPG mechanics. Features level-up 
-            systems, quest-based achievements, and immersive user experience design. Built with modern 
-            design principles and gamification psychology.
-            """,
-            deliverables=[
-                "High-fidelity interactive prototypes",
-                "User flows & journey mapping",
-                "Interaction specifications & micro-animations",
-                "Design system documentation"
-            ],
-            tools=["Adobe XD", "Figma", "Kivy", "Python"],
-            links={
-                "Behance": "https://www.behance.net/",
-                "Prototype": "#"
-            },
-            tags=["UI/UX", "Mobile Design", "Gamification", "Prototyping"]
-        ),
-    ]
+    projects = portfolio.projects
+    page = render_pager(len(projects), PROJECTS_PER_PAGE, key=f"projects_page_{portfolio.tenant}")
+    start = page * PROJECTS_PER_PAGE
     
-    for idx, project in enumerate(projects):
-        render_project_card(project, expanded=(idx == 0))
+    for idx, project in enumerate(projects[start:start + PROJECTS_PER_PAGE], start=start):
+        render_project_card(portfolio, idx, project, expanded=(idx == 0))
         st.markdown("<br>", unsafe_allow_html=True)
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def render_skills():
+def render_skills(portfolio: Portfolio):
     """Skills page content"""
     st.markdown('<div class="card fade-in">', unsafe_allow_html=True)
     st.header("Skills & Expertise")
     st.write("A comprehensive overview of technical and soft skills I bring to every project.")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.subheader("💻 Technical")
-        st.markdown("""
-        - **Languages:** Python, SQL
-        - **Data Science:** Pandas, NumPy, scikit-learn
-        - **ML/AI:** XGBoost, TensorFlow basics
-        - **Survival Analysis:** lifelines
-        - **Visualization:** Matplotlib, Seaborn, Plotly
-        - **Tools:** Jupyter, Git, Streamlit
-        """)
-    
-    with col2:
-        st.subheader("🎨 Design")
-        st.markdown("""
-        - **UI/UX Design:** Adobe XD, Figma
-        - **Prototyping:** Interactive mockups
-        - **Design Systems:** Component libraries
-        - **User Research:** Journey mapping
-        - **Wireframing:** Low to high fidelity
-        - **Visual Design:** Typography, color theory
-        """)
-    
-    with col3:
-        st.subheader("🤝 Soft Skills")
-        st.markdown("""
-        - **Communication:** Clear & effective
-        - **Problem Solving:** Analytical thinking
-        - **Collaboration:** Cross-functional teams
-        - **Presentation:** Data storytelling
-        - **Adaptability:** Quick learner
-        - **Leadership:** Team coordination
-        """)
+    if portfolio.skills:
+        cols = st.columns(len(portfolio.skills))
+        for col, (heading, items) in zip(cols, portfolio.skills.items()):
+            with col:
+                st.subheader(heading)
+                st.markdown("\n".join(f"- {item}" for item in items))
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def render_courses():
+def render_courses(portfolio: Portfolio):
     """Courses page content"""
     st.markdown('<div class="card fade-in">', unsafe_allow_html=True)
     st.header("Courses & Certifications")
     st.write("Continuous learning through structured courses and professional development.")
     
-    courses = [
-        {
-            "name": "Survival Analysis & Time-to-Event Modeling",
-            "provider": "Boston Institute of Analytics",
-            "status": "Completed",
-            "year": "2024"
-        },
-        {
-            "name": "UI/UX Design Fundamentals",
-            "provider": "Adobe XD",
-            "status": "Completed",
-            "year": "2023"
-        },
-        {
-            "name": "Python for Data Science",
-            "provider": "Online Course",
-            "status": "Completed",
-            "year": "2023"
-        },
-        {
-            "name": "Machine Learning Specialization",
-            "provider": "In Progress",
-            "status": "Ongoing",
-            "year": "2024"
-        }
-    ]
-    
-    for course in courses:
+    for entry in render_period_filter(portfolio.timeline.of_kind("course"), key="courses"):
+        course = entry.data
         with st.expander(f"📚 {course['name']}"):
             col1, col2 = st.columns(2)
             with col1:
@@ -589,34 +311,14 @@ def render_courses():
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def render_education():
+def render_education(portfolio: Portfolio):
     """Education page content"""
     st.markdown('<div class="card fade-in">', unsafe_allow_html=True)
     st.header("Education")
     st.write("Academic background and formal qualifications.")
     
-    education = [
-        {
-            "degree": "B.Sc. Biotechnology, Genetics & Chemistry",
-            "institution": "Bhavans Vivekananda Degree College",
-            "period": "2019 - 2022",
-            "details": "Focus on life sciences with strong foundation in scientific methodology"
-        },
-        {
-            "degree": "Intermediate (12th Grade)",
-            "institution": "Sri Chaitanya Junior College",
-            "period": "2017 - 2019",
-            "details": "Science stream with emphasis on Biology and Chemistry"
-        },
-        {
-            "degree": "Secondary Education (10th Grade)",
-            "institution": "Buds and Flowers High School",
-            "period": "Till 2017",
-            "details": "Strong academic foundation"
-        }
-    ]
-    
-    for edu in education:
+    for entry in render_period_filter(portfolio.timeline.of_kind("education"), key="education"):
+        edu = entry.data
         st.markdown(f"### 🎓 {edu['degree']}")
         st.write(f"**{edu['institution']}** | *{edu['period']}*")
         st.write(edu['details'])
@@ -624,38 +326,14 @@ def render_education():
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def render_experience():
+def render_experience(portfolio: Portfolio):
     """Experience page content"""
     st.markdown('<div class="card fade-in">', unsafe_allow_html=True)
     st.header("Professional Experience")
     st.write("Work history and professional achievements.")
     
-    experiences = [
-        {
-            "title": "Junior Associate",
-            "company": "Synchrony Financial",
-            "period": "Sep 2022 – May 2023",
-            "responsibilities": [
-                "Part of a pilot team handling high-volume financial transactions",
-                "Worked with international clients on complex account management",
-                "Resolved escalations efficiently with focus on customer satisfaction",
-                "Gained expertise in process-driven operations and compliance"
-            ]
-        },
-        {
-            "title": "Customer Service Representative",
-            "company": "Concentrix (Google Operations)",
-            "period": "Jul 2023 – Oct 2023",
-            "responsibilities": [
-                "Provided technical and non-technical support for YouTube TV customers",
-                "Maintained high CSAT scores through efficient troubleshooting",
-                "Handled complex customer inquiries with professionalism",
-                "Collaborated with cross-functional teams for issue resolution"
-            ]
-        }
-    ]
-    
-    for exp in experiences:
+    for entry in render_period_filter(portfolio.timeline.of_kind("experience"), key="experience"):
+        exp = entry.data
         st.markdown(f"### 💼 {exp['title']}")
         st.write(f"**{exp['company']}** | *{exp['period']}*")
         for resp in exp['responsibilities']:
@@ -664,34 +342,29 @@ def render_experience():
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def render_contact():
+def render_contact(portfolio: Portfolio):
     """Contact page content"""
+    profile = portfolio.profile
     st.markdown('<div class="card fade-in">', unsafe_allow_html=True)
     st.header("Let's Connect")
     st.write("I'm open to collaborations, freelance opportunities, and exciting projects. Reach out!")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
-        <a href="https://www.linkedin.com/in/sunny-solomon/" target="_blank" class="action-btn" style="display:block;text-align:center;margin-bottom:12px">
-        LinkedIn
-        </a>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown("""
-        <a href="https://github.com/Sunny777Solomon" target="_blank" class="action-btn" style="display:block;text-align:center;margin-bottom:12px">
-        GitHub
-        </a>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown("""
-        <a href="mailto:sunnysolomon20@gmail.com" class="action-btn" style="display:block;text-align:center;margin-bottom:12px">
-        Email
-        </a>
-        """, unsafe_allow_html=True)
+    contact_links = [
+        ("LinkedIn", safe_url(profile["linkedin"]), ' target="_blank"'),
+        ("GitHub", safe_url(profile["github"]), ' target="_blank"'),
+        ("Email", safe_url(f"mailto:{profile['email']}") if profile["email"] else None, ""),
+    ]
+    contact_links = [link for link in contact_links if link[1]]
+    
+    if contact_links:
+        cols = st.columns(len(contact_links))
+        for col, (label, href, target) in zip(cols, contact_links):
+            with col:
+                st.markdown(f"""
+                <a href="{href}"{target} class="action-btn" style="display:block;text-align:center;margin-bottom:12px">
+                {label}
+                </a>
+                """, unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -714,6 +387,9 @@ def render_contact():
     
     st.markdown("</div>", unsafe_allow_html=True)
     
+    if not profile["demo"]:
+        return
+    
     # Demo Integration Section
     st.markdown('<div class="card fade-in">', unsafe_allow_html=True)
     st.subheader("🔬 Live Demo: Breast Cancer Risk Prediction")
@@ -723,7 +399,11 @@ def render_contact():
         import bc_app
         if hasattr(bc_app, "run"):
             st.info("Loading interactive demo...")
-            bc_app.run()
+            if hasattr(bc_app, "predict_batch"):
+                # Share one batching executor across all sessions
+                bc_app.run(predict=inference_service(bc_app.predict_batch).predict)
+            else:
+                bc_app.run()
         else:
             st.warning("Demo module found but run() function not available.")
     except ImportError:
@@ -733,7 +413,9 @@ def render_contact():
         To add the live Breast Cancer Risk Prediction demo:
         1. Create a file named `bc_app.py` in the same directory
         2. Add a `def run():` function that contains your Streamlit app code
-        3. The demo will automatically load in this section
+        3. Optionally add a module-level `def predict_batch(X):` that scores an array of
+           patient rows; `run(predict=...)` then receives a shared, batched single-row predictor
+        4. The demo will automatically load in this section
         
         Or visit the standalone demo at: 
         [GitHub Repository](https://github.com/Sunny777Solomon/Breast-cancer-Risk-Prediction-streamlit)
@@ -745,6 +427,15 @@ def render_contact():
 # MAIN APPLICATION
 # ============================================================================
 def main():
+    # Resolve the tenant before anything is rendered
+    try:
+        portfolio = current_portfolio()
+    except (OSError, ValueError) as exc:
+        configure_page("Portfolio")
+        st.error(f"This portfolio is unavailable: {exc}")
+        st.stop()
+    configure_page(f"{portfolio.profile['name']} — Portfolio")
+    
     # Load custom CSS
     load_css()
     
@@ -759,29 +450,39 @@ def main():
     current_page = st.session_state["page"]
     
     if current_page == "home":
-        render_home()
+        render_home(portfolio)
     elif current_page == "about":
-        render_about()
+        render_about(portfolio)
     elif current_page == "projects":
-        render_projects()
+        render_projects(portfolio)
     elif current_page == "skills":
-        render_skills()
+        render_skills(portfolio)
     elif current_page == "courses":
-        render_courses()
+        render_courses(portfolio)
     elif current_page == "education":
-        render_education()
+        render_education(portfolio)
     elif current_page == "experience":
-        render_experience()
+        render_experience(portfolio)
     elif current_page == "contact":
-        render_contact()
+        render_contact(portfolio)
     
     # Footer
     st.markdown("---")
     st.markdown(f"""
     <div style="text-align:center;color:#7fb0e7;padding:20px 0;">
-        © {datetime.datetime.now().year} Sunny Solomon — Built with ❤️ using Streamlit
+        © {datetime.datetime.now().year} {escape(portfolio.profile['name'])} — Built with ❤️ using Streamlit
     </div>
     """, unsafe_allow_html=True)
 
+@st.cache_resource(show_spinner=False)
+def memory_profiler() -> Optional[MemoryProfiler]:
+    """Process-wide tracemalloc profiler, enabled by PORTFOLIO_MEMORY_PROFILE"""
+    return MemoryProfiler.from_env()
+
 if __name__ == "__main__":
-    main()
+    profiler = memory_profiler()
+    if profiler is None:
+        main()
+    else:
+        with profiler.profile(lambda: st.session_state.get("page", "home"), globals()):
+            main()
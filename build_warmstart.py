@@ -0,0 +1,16 @@
+# build_warmstart.py
+"""Write the warm-start artifact: ``python build_warmstart.py [path]``."""
+
+import sys
+import time
+
+from warmstart import ARTIFACT_PATH, build_state, save_state
+
+if __name__ == "__main__":
+    started = time.perf_counter()
+    state = build_state()
+    save_state(state, sys.argv[1] if len(sys.argv) > 1 else ARTIFACT_PATH)
+    print(
+        f"Wrote warm-start artifact ({len(state.projects)} projects, {len(state.assets)} assets, "
+        f"{len(state.timeline)} timeline entries) in {time.perf_counter() - started:.3f}s"
+    )
@@ -0,0 +1,217 @@
+# content.py
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+# ============================================================================
+# DATA MODELS
+# ============================================================================
+@dataclass
+class Project:
+    title: str
+    subtitle: str
+    description: str
+    deliverables: List[str]
+    tools: List[str]
+    links: dict
+    tags: List[str]
+    image: Optional[str] = None
+
+# ============================================================================
+# PROFILE
+# ============================================================================
+PROFILE = {
+    "name": "Sunny Solomon",
+    "headline": "Data Science · UI/UX · Music",
+    "intro": (
+        "I build interpretable ML models and user-centered experiences. Welcome to my interactive "
+        "portfolio where you can explore my projects, skills, and professional journey."
+    ),
+    "focus": ["Interpretable ML", "Survival Analysis", "Data Viz"],
+    "location": "Hyderabad, India",
+    "email": "sunnysolomon20@gmail.com",
+    "linkedin": "https://www.linkedin.com/in/sunny-solomon/",
+    "github": "https://github.com/Sunny777Solomon",
+    "photo": "assets/profile.jpg",
+    "resume": "assets/Sunny_Solomon_Resume.pdf",
+    "about": """
+I'm Sunny Solomon — a Data Science and UI/UX enthusiast from Hyderabad, India.
+
+With a background in Life Sciences and a growing passion for AI, Machine Learning, and Data Visualization, 
+I'm focused on transforming complex data into clear, actionable insights that drive impact.
+
+I enjoy blending analytical thinking with creativity, designing meaningful interfaces, and building 
+intelligent, user-centered solutions. Currently, I'm expanding my skills in machine learning, generative 
+AI, and forecasting analytics, while continuously exploring ways to make data more human and intuitive.
+
+**Outside of work:**  
+I'm a musician at heart — a guitarist, keyboard player, and singer who finds rhythm in every detail. 
+I also love football, gaming, and working out, which keep me motivated and balanced.
+
+**My goal:**  
+To keep learning, innovating, and creating — whether through data, design, or music.
+""",
+    "quick_facts": [
+        "🎓 B.Sc. Biotechnology, Genetics & Chemistry",
+        "📍 Hyderabad, Telangana, India",
+        "🎂 Born April 26, 2002",
+        "🎸 Musician (Guitar, Keyboard, Vocals)",
+        "⚽ Football Enthusiast",
+        "🎮 Gamer & Fitness Buff",
+    ],
+    "demo": True,
+}
+
+# ============================================================================
+# SKILLS
+# ============================================================================
+SKILLS = {
+    "💻 Technical": [
+        "**Languages:** Python, SQL",
+        "**Data Science:** Pandas, NumPy, scikit-learn",
+        "**ML/AI:** XGBoost, TensorFlow basics",
+        "**Survival Analysis:** lifelines",
+        "**Visualization:** Matplotlib, Seaborn, Plotly",
+        "**Tools:** Jupyter, Git, Streamlit",
+    ],
+    "🎨 Design": [
+        "**UI/UX Design:** Adobe XD, Figma",
+        "**Prototyping:** Interactive mockups",
+        "**Design Systems:** Component libraries",
+        "**User Research:** Journey mapping",
+        "**Wireframing:** Low to high fidelity",
+        "**Visual Design:** Typography, color theory",
+    ],
+    "🤝 Soft Skills": [
+        "**Communication:** Clear & effective",
+        "**Problem Solving:** Analytical thinking",
+        "**Collaboration:** Cross-functional teams",
+        "**Presentation:** Data storytelling",
+        "**Adaptability:** Quick learner",
+        "**Leadership:** Team coordination",
+    ],
+}
+
+# ============================================================================
+# PROJECTS
+# ============================================================================
+PROJECTS = [
+    Project(
+        title="Breast Cancer Risk Prediction",
+        subtitle="Survival Analysis & Machine Learning",
+        description="""
+        A comprehensive predictive model estimating 10-year mortality risk for breast cancer patients 
+        using clinical and demographic data. This project combines survival analysis techniques 
+        (Kaplan-Meier, Cox PH) with modern machine learning algorithms to enhance prediction accuracy.
+        """,
+        deliverables=[
+            "Data preprocessing & feature engineering pipeline",
+            "Survival curves & hazard visualization (Kaplan-Meier plots)",
+            "Comparative analysis of statistical vs. ML approaches",
+            "Interactive risk prediction interface with patient input"
+        ],
+        tools=["Python", "Pandas", "NumPy", "scikit-learn", "XGBoost", "lifelines", "Matplotlib"],
+        links={
+            "GitHub": "https://github.com/Sunny777Solomon/Breast-cancer-Risk-Prediction-streamlit",
+            "Live Demo": "#demo"
+        },
+        tags=["Healthcare", "Machine Learning", "Survival Analysis", "Python", "Data Science"]
+    ),
+    Project(
+        title="Solo Leveling — Habit Tracker",
+        subtitle="UI/UX Design & Gamification",
+        description="""
+        A dark-themed habit tracker application concept inspired by RPG mechanics. Features level-up 
+        systems, quest-based achievements, and immersive user experience design. Built with modern 
+        design principles and gamification psychology.
+        """,
+        deliverables=[
+            "High-fidelity interactive prototypes",
+            "User flows & journey mapping",
+            "Interaction specifications & micro-animations",
+            "Design system documentation"
+        ],
+        tools=["Adobe XD", "Figma", "Kivy", "Python"],
+        links={
+            "Behance": "https://www.behance.net/",
+            "Prototype": "#"
+        },
+        tags=["UI/UX", "Mobile Design", "Gamification", "Prototyping"]
+    ),
+]
+
+# ============================================================================
+# TIMELINE
+# ============================================================================
+COURSES = [
+    {
+        "name": "Survival Analysis & Time-to-Event Modeling",
+        "provider": "Boston Institute of Analytics",
+        "status": "Completed",
+        "year": "2024"
+    },
+    {
+        "name": "UI/UX Design Fundamentals",
+        "provider": "Adobe XD",
+        "status": "Completed",
+        "year": "2023"
+    },
+    {
+        "name": "Python for Data Science",
+        "provider": "Online Course",
+        "status": "Completed",
+        "year": "2023"
+    },
+    {
+        "name": "Machine Learning Specialization",
+        "provider": "In Progress",
+        "status": "Ongoing",
+        "year": "2024"
+    }
+]
+
+EDUCATION = [
+    {
+        "degree": "B.Sc. Biotechnology, Genetics & Chemistry",
+        "institution": "Bhavans Vivekananda Degree College",
+        "period": "2019 - 2022",
+        "details": "Focus on life sciences with strong foundation in scientific methodology"
+    },
+    {
+        "degree": "Intermediate (12th Grade)",
+        "institution": "Sri Chaitanya Junior College",
+        "period": "2017 - 2019",
+        "details": "Science stream with emphasis on Biology and Chemistry"
+    },
+    {
+        "degree": "Secondary Education (10th Grade)",
+        "institution": "Buds and Flowers High School",
+        "period": "Till 2017",
+        "details": "Strong academic foundation"
+    }
+]
+
+EXPERIENCE = [
+    {
+        "title": "Junior Associate",
+        "company": "Synchrony Financial",
+        "period": "Sep 2022 – May 2023",
+        "responsibilities": [
+            "Part of a pilot team handling high-volume financial transactions",
+            "Worked with international clients on complex account management",
+            "Resolved escalations efficiently with focus on customer satisfaction",
+            "Gained expertise in process-driven operations and compliance"
+        ]
+    },
+    {
+        "title": "Customer Service Representative",
+        "company": "Concentrix (Google Operations)",
+        "period": "Jul 2023 – Oct 2023",
+        "responsibilities": [
+            "Provided technical and non-technical support for YouTube TV customers",
+            "Maintained high CSAT scores through efficient troubleshooting",
+            "Handled complex customer inquiries with professionalism",
+            "Collaborated with cross-functional teams for issue resolution"
+        ]
+    }
+]
@@ -0,0 +1,169 @@
+# inference.py
+
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+PredictBatch = Callable[[np.ndarray], np.ndarray]
+
+
+class BatchingExecutor:
+    """Collect concurrent single-row predictions into vectorized batches.
+
+    Each session thread calls ``submit``/``predict`` with one feature row. A
+    collector thread waits up to ``max_wait_ms`` for more rows (or until
+    ``max_batch`` are queued), stacks them into one 2-D array and runs
+    ``predict_batch`` on it in a small process pool, so model code runs
+    outside the server's GIL. Each caller's future receives its own row of
+    the result.
+
+    ``predict_batch`` must be a picklable module-level function taking an
+    ``(n, features)`` array and returning ``n`` predictions; it should load
+    its model lazily so each worker process loads it once. If a worker dies
+    (OOM, a crash in native model code) the batch it was running fails and
+    the pool is replaced, so later predictions keep working.
+    """
+
+    def __init__(
+        self,
+        predict_batch: PredictBatch,
+        max_batch: int = 64,
+        max_wait_ms: float = 5.0,
+        workers: int = 2,
+    ):
+        self.predict_batch = predict_batch
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._workers = workers
+        self._queue: "queue.Queue[Optional[Tuple[np.ndarray, Future]]]" = queue.Queue()
+        self._pool_lock = threading.Lock()
+        self._pool = self._new_pool()
+        self._closed = False
+        self._thread = threading.Thread(target=self._collect, name="inference-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, row) -> Future:
+        """Queue one feature row and return a future for its prediction."""
+        if self._closed:
+            raise RuntimeError("BatchingExecutor has been shut down")
+        future: Future = Future()
+        self._queue.put((np.asarray(row, dtype=float).ravel(), future))
+        return future
+
+    def predict(self, row, timeout: Optional[float] = 30.0):
+        """Blocking convenience wrapper around ``submit``."""
+        return self.submit(row).result(timeout=timeout)
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting rows; queued rows are still scored."""
+        self._closed = True
+        self._queue.put(None)
+        if wait:
+            self._thread.join()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        # spawn rather than fork: the server process is multi-threaded
+        return ProcessPoolExecutor(
+            max_workers=self._workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _replace_pool(self, broken: ProcessPoolExecutor):
+        with self._pool_lock:
+            if self._pool is broken and not self._closed:
+                self._pool = self._new_pool()
+        broken.shutdown(wait=False)
+
+    def _submit(self, X: np.ndarray) -> Tuple[ProcessPoolExecutor, Future]:
+        pool = self._pool
+        try:
+            return pool, pool.submit(self.predict_batch, X)
+        except BrokenProcessPool:
+            # Nothing from this batch ran yet, so it is safe to retry once
+            self._replace_pool(pool)
+            pool = self._pool
+            return pool, pool.submit(self.predict_batch, X)
+
+    def _collect(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._pool.shutdown(wait=False)
+                return
+            batch = [item]
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._dispatch(batch)
+                    self._pool.shutdown(wait=False)
+                    return
+                batch.append(item)
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[Tuple[np.ndarray, Future]]):
+        # Skip rows whose callers already cancelled, and keep a malformed row
+        # from failing everyone else's batch by grouping on feature count
+        groups: Dict[int, List[Tuple[np.ndarray, Future]]] = {}
+        for row, future in batch:
+            if future.set_running_or_notify_cancel():
+                groups.setdefault(row.shape[0], []).append((row, future))
+        for live in groups.values():
+            rows, futures = zip(*live)
+            try:
+                pool, result = self._submit(np.stack(rows))
+            except Exception as exc:
+                for future in futures:
+                    future.set_exception(exc)
+                continue
+            result.add_done_callback(
+                lambda done, pool=pool, futures=futures: self._fan_out(done, pool, futures)
+            )
+
+    def _fan_out(self, done: Future, pool: ProcessPoolExecutor, futures: Tuple[Future, ...]):
+        """Hand each caller its row of a finished batch."""
+        try:
+            predictions = done.result()
+            if len(predictions) != len(futures):
+                raise ValueError(
+                    f"predict_batch returned {len(predictions)} results for {len(futures)} rows"
+                )
+        except Exception as exc:
+            if isinstance(exc, BrokenProcessPool):
+                self._replace_pool(pool)
+            for future in futures:
+                future.set_exception(exc)
+            return
+        for future, prediction in zip(futures, predictions):
+            future.set_result(prediction)
+
+
+_executors: Dict[str, BatchingExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def inference_service(predict_batch: PredictBatch) -> BatchingExecutor:
+    """Process-wide executor for ``predict_batch``, shared by every session.
+
+    Keyed by the function's qualified name; when Streamlit reloads an edited
+    module the new function object replaces the old executor.
+    """
+    name = f"{predict_batch.__module__}.{predict_batch.__qualname__}"
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None or executor.predict_batch is not predict_batch:
+            if executor is not None:
+                executor.shutdown(wait=False)
+            executor = _executors[name] = BatchingExecutor(predict_batch)
+    return executor
@@ -0,0 +1,165 @@
+# memprofile.py
+"""Opt-in allocation profiling around sampled script reruns.
+
+Set ``PORTFOLIO_MEMORY_PROFILE=1`` to enable. Every Nth ``main()`` run
+(``PORTFOLIO_MEMORY_PROFILE_EVERY``, default 10) is wrapped in tracemalloc
+snapshots taken after a ``gc.collect()``, keeping only allocations made from
+the app's own files; the difference is what the rerun left behind. Retained
+bytes are attributed to the innermost ``render_*`` function on each
+allocation's traceback, the top allocating lines are written to a rotating
+report (``PORTFOLIO_MEMORY_REPORT``, default ``build/memory.log``), and a
+route is flagged once its retained memory has grown on ``GROWTH_WINDOW``
+consecutive sampled reruns.
+
+Only one rerun is sampled at a time and other reruns never wait for it, so
+allocations from concurrent sessions can still show up in a diff; this is a
+diagnostic mode, not for production traffic.
+"""
+
+import gc
+import inspect
+import logging
+import os
+import threading
+import tracemalloc
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from static_assets import BASE_DIR
+
+REPORT_PATH = os.path.join(BASE_DIR, "build", "memory.log")
+# Deep enough to reach the render_* caller of a Streamlit element
+TRACE_FRAMES = 5
+SAMPLE_EVERY = 10
+TOP_ALLOCATORS = 10
+GROWTH_WINDOW = 5
+# Ignore growth below this many bytes per rerun (interned strings, caches warming up)
+GROWTH_THRESHOLD = 4096
+
+_FILTERS = [
+    tracemalloc.Filter(True, os.path.join(BASE_DIR, "*"), all_frames=True),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+]
+
+FunctionSpan = Tuple[str, int, int, str]
+
+
+def render_functions(namespace: Dict) -> List[FunctionSpan]:
+    """Source spans ``(filename, first, last, name)`` of ``render_*`` functions."""
+    spans = []
+    for name, obj in namespace.items():
+        if not name.startswith("render_") or not callable(obj):
+            continue
+        func = inspect.unwrap(obj)
+        code = getattr(func, "__code__", None)
+        if code is None:
+            continue
+        lines = [line for _, _, line in code.co_lines() if line is not None]
+        spans.append((code.co_filename, code.co_firstlineno, max(lines, default=code.co_firstlineno), name))
+    return spans
+
+
+class MemoryProfiler:
+    def __init__(
+        self,
+        report_path: str = REPORT_PATH,
+        sample_every: int = SAMPLE_EVERY,
+        max_bytes: int = 1 << 20,
+        backups: int = 5,
+    ):
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        self.logger = logging.getLogger("portfolio.memory")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        if not self.logger.handlers:
+            handler = RotatingFileHandler(report_path, maxBytes=max_bytes, backupCount=backups)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+            self.logger.addHandler(handler)
+        self.sample_every = max(1, sample_every)
+        self._reruns = 0
+        self._counter_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._history: Dict[str, Deque[int]] = defaultdict(lambda: deque(maxlen=GROWTH_WINDOW))
+        self.retained: Dict[str, int] = defaultdict(int)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+
+    @classmethod
+    def from_env(cls) -> Optional["MemoryProfiler"]:
+        if os.environ.get("PORTFOLIO_MEMORY_PROFILE", "").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(
+            os.environ.get("PORTFOLIO_MEMORY_REPORT", REPORT_PATH),
+            int(os.environ.get("PORTFOLIO_MEMORY_PROFILE_EVERY", SAMPLE_EVERY)),
+        )
+
+    def _sample(self) -> bool:
+        with self._counter_lock:
+            self._reruns += 1
+            return self._reruns % self.sample_every == 0
+
+    @contextmanager
+    def profile(self, route: Callable[[], str], namespace: Dict) -> Iterator[None]:
+        """Snapshot around one sampled rerun and report what it retained.
+
+        ``route`` is called after the rerun, so the diff is filed under the
+        page the rerun ended on rather than the one it started from.
+        """
+        # Skip instead of waiting when another rerun is already being sampled
+        if not self._sample() or not self._lock.acquire(blocking=False):
+            yield
+            return
+        try:
+            gc.collect()
+            before = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+            try:
+                yield
+            finally:
+                gc.collect()
+                after = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+                self._report(route(), before, after, render_functions(namespace))
+        finally:
+            self._lock.release()
+
+    def _report(self, route: str, before, after, spans: List[FunctionSpan]):
+        by_function: Dict[str, int] = defaultdict(int)
+        by_line: Dict[Tuple[str, int], List[int]] = defaultdict(lambda: [0, 0])
+        for stat in after.compare_to(before, "traceback"):
+            if not stat.size_diff:
+                continue
+            by_function[_attribute(stat.traceback, spans)] += stat.size_diff
+            # Tracebacks run oldest to newest; the last frame did the allocating
+            frame = stat.traceback[-1]
+            line = by_line[frame.filename, frame.lineno]
+            line[0] += stat.size_diff
+            line[1] += stat.count_diff
+        retained = sum(by_function.values())
+        self.retained[route] += retained
+
+        lines = [f"route={route} retained={retained:+d}B total={self.retained[route]:+d}B"]
+        for name, size in sorted(by_function.items(), key=lambda item: -abs(item[1])):
+            lines.append(f"  {name}: {size:+d}B")
+        lines.append("  top allocators:")
+        allocators = sorted(by_line.items(), key=lambda item: -abs(item[1][0]))
+        for (filename, lineno), (size, count) in allocators[:TOP_ALLOCATORS]:
+            lines.append(f"    {filename}:{lineno}: {size:+d}B ({count:+d} blocks)")
+        self.logger.info("\n".join(lines))
+
+        history = self._history[route]
+        history.append(retained)
+        if len(history) == GROWTH_WINDOW and all(size > GROWTH_THRESHOLD for size in history):
+            self.logger.warning(
+                "route=%s retained memory grew on %d consecutive reruns (%+dB)",
+                route, GROWTH_WINDOW, sum(history),
+            )
+
+
+def _attribute(traceback, spans: List[FunctionSpan]) -> str:
+    """Name of the innermost ``render_*`` function on the traceback."""
+    for frame in reversed(traceback):
+        for filename, first, last, name in spans:
+            if frame.filename == filename and first <= frame.lineno <= last:
+                return name
+    return "<other>"
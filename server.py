@@ -0,0 +1,16 @@
+# server.py
+"""ASGI entry point: ``streamlit run server.py``.
+
+Wraps app.py in ``st.App`` so the fingerprinted assets published by
+static_assets.py are served with immutable cache headers.
+"""
+
+import streamlit as st
+from starlette.middleware import Middleware
+
+from static_assets import ImmutableAssetsMiddleware, build_manifest
+
+# Publish before the server starts so static serving finds ./static at boot
+build_manifest()
+
+app = st.App("app.py", middleware=[Middleware(ImmutableAssetsMiddleware)])
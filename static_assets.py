@@ -0,0 +1,151 @@
+# static_assets.py
+
+import hashlib
+import os
+import shutil
+import tempfile
+from typing import Dict, Iterable
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(BASE_DIR, "assets")
+# Streamlit only serves files from ./static next to the main script
+# (server.enableStaticServing); fingerprinted copies live in a subfolder we own.
+STATIC_DIR = os.path.join(BASE_DIR, "static", "assets")
+STATIC_URL = "app/static/assets"
+HASH_LENGTH = 12
+# Tenants' files are published below this, one directory per tenant id
+TENANT_STATIC_DIR = os.path.join(STATIC_DIR, "_tenants")
+TENANT_STATIC_URL = f"{STATIC_URL}/_tenants"
+# Every file under STATIC_URL has its content hash in its name, so it never changes
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def fingerprint(path: str) -> str:
+    """Return a short content hash for the file at ``path``."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:HASH_LENGTH]
+
+
+def _publish(src: str, dest: str):
+    """Copy ``src`` to ``dest`` atomically, skipping files already published.
+
+    Each writer copies into its own temporary file, so concurrent publishers
+    of the same file never see each other's partial copies. The name carries
+    the content hash, so whichever copy lands first is the right one.
+    """
+    if os.path.exists(dest):
+        return
+    fd, tmp = tempfile.mkstemp(
+        prefix=f"{os.path.basename(dest)}.", suffix=".tmp", dir=os.path.dirname(dest)
+    )
+    try:
+        with os.fdopen(fd, "wb") as out, open(src, "rb") as f:
+            shutil.copyfileobj(f, out)
+        os.replace(tmp, dest)
+    except OSError:
+        if not os.path.exists(dest):
+            raise
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def build_manifest(
+    assets_dir: str = ASSETS_DIR,
+    static_dir: str = STATIC_DIR,
+    static_url: str = STATIC_URL,
+    key_prefix: str = "assets/",
+    exclude: Iterable[str] = (),
+) -> Dict[str, str]:
+    """Fingerprint every file in ``assets_dir`` and publish it for static serving.
+
+    Returns a mapping of ``<key_prefix><relative path>`` to a stable URL of the
+    form ``<static_url>/<name>.<hash><ext>``. The hashed filename guarantees a
+    changed file gets a new URL; ``ImmutableAssetsMiddleware`` marks responses
+    for these URLs as cacheable forever. Relative paths in ``exclude`` are not
+    published. Each tenant publishes into its own namespace under
+    ``TENANT_STATIC_DIR``, which the default manifest leaves alone.
+    """
+    manifest = {}
+    if not os.path.isdir(assets_dir):
+        return manifest
+
+    exclude = set(exclude)
+    real_root = os.path.realpath(assets_dir)
+    os.makedirs(static_dir, exist_ok=True)
+    published = set()
+    for root, _, files in os.walk(assets_dir):
+        for name in sorted(files):
+            src = os.path.join(root, name)
+            rel = os.path.relpath(src, assets_dir).replace(os.sep, "/")
+            # Skip excluded files and symlinks pointing outside the directory
+            if rel in exclude or os.path.commonpath([real_root, os.path.realpath(src)]) != real_root:
+                continue
+            digest = fingerprint(src)
+            stem, ext = os.path.splitext(rel)
+            hashed = f"{stem}.{digest}{ext}"
+            dest = os.path.join(static_dir, *hashed.split("/"))
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            _publish(src, dest)
+            published.add(os.path.normpath(dest))
+            manifest[f"{key_prefix}{rel}"] = f"{static_url}/{hashed}"
+
+    # Drop fingerprints of files that have since changed or been removed,
+    # without reaching into tenant namespaces nested below this one
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != TENANT_STATIC_DIR]
+        for name in files:
+            if name.endswith(".tmp"):
+                continue
+            path = os.path.normpath(os.path.join(root, name))
+            if path not in published:
+                os.remove(path)
+    return manifest
+
+
+def build_tenant_manifest(tenant: str, tenant_dir: str) -> Dict[str, str]:
+    """Publish a tenant's directory into its own static namespace.
+
+    Keys are paths relative to ``tenant_dir``; the tenant's portfolio.json is
+    not published.
+    """
+    return build_manifest(
+        tenant_dir,
+        os.path.join(TENANT_STATIC_DIR, tenant),
+        f"{TENANT_STATIC_URL}/{tenant}",
+        key_prefix="",
+        exclude=("portfolio.json",),
+    )
+
+
+class ImmutableAssetsMiddleware:
+    """ASGI middleware adding long-lived cache headers to fingerprinted assets.
+
+    Streamlit's ``/app/static/`` route sends no ``Cache-Control`` header, so
+    browsers would revalidate every asset. Registered through ``st.App`` in
+    server.py, this stamps ``CACHE_CONTROL`` on successful responses under
+    ``/app/static/assets/``; other paths pass through untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or f"/{STATIC_URL}/" not in scope["path"]:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache_headers(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = [
+                    (name, value) for name, value in message.get("headers", [])
+                    if name.lower() != b"cache-control"
+                ]
+                headers.append((b"cache-control", CACHE_CONTROL.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_headers)
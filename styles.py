@@ -0,0 +1,230 @@
+# styles.py
+
+CSS = """
+    <style>
+    /* ========== Base Styles ========== */
+    .stApp {
+        background: radial-gradient(circle at 10% 20%, #071226 0%, #05050a 40%, #030305 100%);
+        color: #e6eef8;
+        font-family: "Inter", -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+    }
+
+    .main > div {
+        max-width: 980px;
+        margin: 0 auto;
+        padding: 20px;
+    }
+
+    /* ========== Navigation ========== */
+    div[data-testid="column"] button {
+        width: 100%;
+        border-radius: 999px;
+        font-weight: 600;
+        transition: all 0.18s ease;
+        border: 1px solid rgba(60,130,255,0.12);
+        background: transparent;
+        color: #dff0ff;
+    }
+
+    div[data-testid="column"] button:hover {
+        transform: translateY(-2px);
+        background: linear-gradient(90deg, rgba(10,32,86,0.6), rgba(8,16,40,0.4));
+        box-shadow: 0 10px 30px rgba(15,55,140,0.25);
+        border-color: rgba(60,150,255,0.26);
+    }
+
+    /* ========== Cards ========== */
+    .card {
+        background: linear-gradient(180deg, rgba(9,18,34,0.55), rgba(6,10,20,0.44));
+        border-radius: 12px;
+        padding: 24px;
+        border: 1px solid rgba(255,255,255,0.03);
+        margin-bottom: 16px;
+        box-shadow: 0 6px 20px rgba(2,8,20,0.6);
+        transition: transform 0.2s ease, box-shadow 0.2s ease;
+    }
+
+    .card:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 8px 25px rgba(10, 40, 100, 0.4);
+    }
+
+    /* ========== Hero Section ========== */
+    .hero-container {
+        display: flex;
+        gap: 32px;
+        align-items: center;
+        margin-bottom: 32px;
+        padding: 24px;
+        background: linear-gradient(180deg, rgba(9,18,34,0.55), rgba(6,10,20,0.44));
+        border-radius: 16px;
+        border: 1px solid rgba(255,255,255,0.03);
+    }
+
+    .hero-image {
+        width: 180px;
+        height: 180px;
+        border-radius: 16px;
+        overflow: hidden;
+        box-shadow: 0 12px 40px rgba(10,30,80,0.6);
+        border: 2px solid rgba(190,227,255,0.2);
+        animation: floaty 6s ease-in-out infinite;
+        flex-shrink: 0;
+    }
+
+    @keyframes floaty {
+        0%, 100% { transform: translateY(0px); }
+        50% { transform: translateY(-8px); }
+    }
+
+    .hero-title {
+        font-size: 32px;
+        font-weight: 800;
+        color: #e7f5ff;
+        margin-bottom: 8px;
+    }
+
+    .hero-subtitle {
+        font-size: 16px;
+        color: #bcd9ff;
+        margin-bottom: 16px;
+    }
+
+    .hero-description {
+        color: #a9cbe8;
+        line-height: 1.6;
+        margin-bottom: 20px;
+    }
+
+    /* ========== Buttons ========== */
+    .action-btn {
+        display: inline-block;
+        background: linear-gradient(90deg, #0b5cff, #2ea0ff);
+        color: white;
+        padding: 10px 20px;
+        border-radius: 999px;
+        text-decoration: none;
+        font-weight: 700;
+        margin-right: 10px;
+        margin-top: 8px;
+        transition: all 0.2s ease;
+    }
+
+    .action-btn:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 20px rgba(11,92,255,0.4);
+        text-decoration: none;
+        color: white;
+    }
+
+    /* ========== Project Tags ========== */
+    .project-tag {
+        background: rgba(11,92,255,0.2);
+        color: #5db4ff;
+        padding: 6px 12px;
+        border-radius: 12px;
+        font-size: 12px;
+        margin-right: 8px;
+        margin-bottom: 8px;
+        display: inline-block;
+        border: 1px solid rgba(11,92,255,0.3);
+    }
+
+    /* ========== Tech Stack ========== */
+    .tech-item {
+        background: rgba(60,130,255,0.15);
+        padding: 12px;
+        border-radius: 8px;
+        text-align: center;
+        margin: 4px;
+        border: 1px solid rgba(60,130,255,0.2);
+        transition: all 0.2s ease;
+    }
+
+    .tech-item:hover {
+        background: rgba(60,130,255,0.25);
+        transform: translateY(-2px);
+    }
+
+    /* ========== Info Cards ========== */
+    .info-card {
+        background: linear-gradient(135deg, rgba(11,92,255,0.1), rgba(46,160,255,0.05));
+        padding: 20px;
+        border-radius: 12px;
+        border: 1px solid rgba(60,130,255,0.2);
+        text-align: center;
+    }
+
+    .info-card strong {
+        color: #5db4ff;
+        font-size: 14px;
+        display: block;
+        margin-bottom: 8px;
+    }
+
+    .info-card-content {
+        color: #bcdcff;
+        font-size: 15px;
+    }
+
+    /* ========== Expander Styling ========== */
+    .streamlit-expanderHeader {
+        background: linear-gradient(90deg, rgba(11,92,255,0.1), rgba(46,160,255,0.05));
+        border-radius: 8px;
+        border: 1px solid rgba(60,130,255,0.2);
+        font-weight: 600;
+        color: #e7f5ff;
+    }
+
+    /* ========== Section Headers ========== */
+    h1, h2, h3 {
+        color: #e7f5ff;
+    }
+
+    /* ========== Mobile Responsive ========== */
+    @media (max-width: 768px) {
+        .hero-container {
+            flex-direction: column;
+            text-align: center;
+        }
+
+        .hero-image {
+            width: 140px;
+            height: 140px;
+        }
+
+        .hero-title {
+            font-size: 24px;
+        }
+
+        .hero-subtitle {
+            font-size: 14px;
+        }
+
+        div[data-testid="column"] {
+            min-width: 100% !important;
+        }
+    }
+
+    /* ========== Animations ========== */
+    .fade-in {
+        animation: fadeUp 0.85s ease both;
+    }
+
+    @keyframes fadeUp {
+        from {
+            opacity: 0;
+            transform: translateY(20px);
+        }
+        to {
+            opacity: 1;
+            transform: translateY(0);
+        }
+    }
+
+    /* ========== Hide Streamlit Branding ========== */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+    </style>
+    """
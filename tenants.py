@@ -0,0 +1,340 @@
+# tenants.py
+"""Serve many portfolios from one Streamlit process.
+
+Each tenant lives in ``tenants/<tenant-id>/portfolio.json`` with the same
+shapes as content.py::
+
+    {
+        "profile": {"name": "...", "headline": "...", ...},
+        "skills": {"💻 Technical": ["**Languages:** Python"], ...},
+        "projects": [{"title": "...", "subtitle": "...", ...}],
+        "courses": [...], "education": [...], "experience": [...]
+    }
+
+The tenant is picked from ``?tenant=<id>`` or, failing that, the first label
+of the Host header (``alice.example.com`` -> ``alice``). Requests that match
+no tenant directory get the built-in portfolio from content.py. Profile
+``photo``/``resume`` paths are relative to the tenant's directory, whose files
+are published under their own static namespace. CSS and code are shared;
+loaded portfolios and their rendered fragments live in bounded LRU caches.
+Tenant data is untrusted: portfolio.json is checked against those shapes when
+it is loaded, anything placed into HTML is escaped and links are limited to
+http(s)/mailto.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, Hashable, List, Mapping, Optional, TypeVar
+
+from content import PROFILE, SKILLS, Project
+from static_assets import BASE_DIR, build_tenant_manifest
+from timeline import TimelineIndex, build_timeline
+from warmstart import ProjectFragments, WarmState, render_fragments
+
+TENANTS_DIR = os.path.join(BASE_DIR, "tenants")
+DEFAULT_TENANT = "default"
+MAX_TENANTS = int(os.environ.get("PORTFOLIO_MAX_TENANTS", "256"))
+MAX_FRAGMENTS = int(os.environ.get("PORTFOLIO_MAX_FRAGMENTS", "64"))
+# How often a loaded tenant's directory is rescanned for changes
+CHECK_INTERVAL = float(os.environ.get("PORTFOLIO_TENANT_CHECK_SECONDS", "5"))
+_TENANT_ID = re.compile(r"^[a-z0-9][a-z0-9_-]{0,62}$")
+_REMOTE_URL = re.compile(r"^https?://", re.IGNORECASE)
+
+PROFILE_DEFAULTS = {
+    "name": "",
+    "headline": "",
+    "intro": "",
+    "focus": [],
+    "location": "",
+    "email": "",
+    "linkedin": "",
+    "github": "",
+    "photo": "",
+    "resume": "",
+    "about": "",
+    "quick_facts": [],
+    "demo": False,
+}
+
+# Fields each section's entries must carry, and their types. ``list`` means a
+# list of strings and ``dict`` a mapping of strings to strings.
+PROJECT_FIELDS = {
+    "title": str,
+    "subtitle": str,
+    "description": str,
+    "deliverables": list,
+    "tools": list,
+    "links": dict,
+    "tags": list,
+}
+SECTION_FIELDS = {
+    "courses": {"name": str, "provider": str, "status": str, "year": str},
+    "education": {"degree": str, "institution": str, "period": str, "details": str},
+    "experience": {"title": str, "company": str, "period": str, "responsibilities": list},
+}
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: K, value: V):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_create(self, key: K, factory: Callable[[], V]) -> V:
+        value = self.get(key)
+        if value is None:
+            # Built outside the lock so a slow load does not block other tenants
+            value = factory()
+            self.put(key, value)
+        return value
+
+
+@dataclass
+class Portfolio:
+    tenant: str
+    profile: Dict
+    skills: Dict[str, List[str]]
+    projects: List[Project]
+    timeline: TimelineIndex
+    # Directory that profile asset paths are relative to, and its published manifest
+    asset_root: str = BASE_DIR
+    assets: Dict[str, str] = field(default_factory=dict)
+    mtime: float = 0.0
+    # time.monotonic() of the last check that mtime is still current
+    checked_at: float = 0.0
+    fragments: LRUCache = field(default_factory=lambda: LRUCache(MAX_FRAGMENTS))
+
+    def project_fragments(self, idx: int, project: Project) -> ProjectFragments:
+        """Fragments for ``project``, cached by its position in ``projects``."""
+        return self.fragments.get_or_create(idx, lambda: render_fragments(project))
+
+    def asset_url(self, path: str, fallback: Optional[str] = None) -> Optional[str]:
+        """URL for an http(s) link or a file inside ``asset_root``, else ``fallback``.
+
+        Paths resolving outside ``asset_root`` are rejected, so a tenant can
+        only serve files from its own directory.
+        """
+        if not path:
+            return fallback
+        if _REMOTE_URL.match(path):
+            return path
+        root = os.path.normpath(self.asset_root)
+        resolved = os.path.normpath(os.path.join(root, path))
+        if os.path.commonpath([root, resolved]) != root:
+            return fallback
+        return self.assets.get(os.path.relpath(resolved, root).replace(os.sep, "/"), fallback)
+
+
+def default_portfolio(state: WarmState) -> Portfolio:
+    """The built-in portfolio, reusing the precompiled warm state."""
+    portfolio = Portfolio(
+        tenant=DEFAULT_TENANT,
+        profile={**PROFILE_DEFAULTS, **PROFILE},
+        skills=SKILLS,
+        projects=state.projects,
+        timeline=state.timeline,
+        assets=state.assets,
+        fragments=LRUCache(max(MAX_FRAGMENTS, len(state.fragments))),
+    )
+    for idx, fragments in enumerate(state.fragments):
+        portfolio.fragments.put(idx, fragments)
+    return portfolio
+
+
+def tenant_dir(tenant: str) -> str:
+    return os.path.join(TENANTS_DIR, tenant)
+
+
+def portfolio_path(tenant: str) -> str:
+    return os.path.join(tenant_dir(tenant), "portfolio.json")
+
+
+def tenant_mtime(tenant: str) -> float:
+    """Latest modification time of anything in the tenant's directory."""
+    mtimes = [os.path.getmtime(portfolio_path(tenant))]
+    for root, _, files in os.walk(tenant_dir(tenant)):
+        mtimes.extend(os.path.getmtime(os.path.join(root, name)) for name in files)
+    return max(mtimes)
+
+
+def _check(value, expected: type, where: str):
+    """Raise ValueError unless ``value`` has the shape ``expected`` describes."""
+    if expected is list:
+        ok = isinstance(value, list) and all(isinstance(item, str) for item in value)
+        kind = "list of strings"
+    elif expected is dict:
+        ok = isinstance(value, dict) and all(
+            isinstance(k, str) and isinstance(v, str) for k, v in value.items()
+        )
+        kind = "mapping of strings"
+    else:
+        ok = isinstance(value, expected)
+        kind = expected.__name__
+    if not ok:
+        raise ValueError(f"{where} must be a {kind}")
+
+
+def _check_entries(entries, fields: Dict[str, type], where: str) -> List[dict]:
+    if not isinstance(entries, list):
+        raise ValueError(f"{where} must be a list")
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"{where}[{i}] must be an object")
+        for name, expected in fields.items():
+            if name not in entry:
+                raise ValueError(f"{where}[{i}] is missing {name!r}")
+            _check(entry[name], expected, f"{where}[{i}].{name}")
+    return entries
+
+
+def validate_portfolio(data) -> dict:
+    """Check untrusted portfolio JSON against the shapes content.py uses.
+
+    Returns the sections with profile defaults filled in; raises ValueError
+    naming the first offending field.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("portfolio must be an object")
+    profile = data.get("profile", {})
+    if not isinstance(profile, dict):
+        raise ValueError("profile must be an object")
+    profile = {**PROFILE_DEFAULTS, **profile}
+    for name, default in PROFILE_DEFAULTS.items():
+        _check(profile[name], type(default), f"profile.{name}")
+
+    skills = data.get("skills", {})
+    if not isinstance(skills, dict):
+        raise ValueError("skills must be an object")
+    for heading, items in skills.items():
+        _check(items, list, f"skills[{heading!r}]")
+
+    projects = _check_entries(data.get("projects", []), PROJECT_FIELDS, "projects")
+    for i, project in enumerate(projects):
+        unknown = set(project) - set(PROJECT_FIELDS) - {"image"}
+        if unknown:
+            raise ValueError(f"projects[{i}] has unknown fields {sorted(unknown)}")
+        if project.get("image") is not None:
+            _check(project["image"], str, f"projects[{i}].image")
+
+    sections = {
+        name: _check_entries(data.get(name, []), fields, name)
+        for name, fields in SECTION_FIELDS.items()
+    }
+    return {"profile": profile, "skills": skills, "projects": projects, **sections}
+
+
+def load_portfolio(tenant: str) -> Portfolio:
+    """Read a tenant's portfolio.json and publish its files; raises ValueError
+    if the portfolio is malformed."""
+    path = portfolio_path(tenant)
+    mtime = tenant_mtime(tenant)
+    with open(path, encoding="utf-8") as f:
+        try:
+            data = validate_portfolio(json.load(f))
+        except (json.JSONDecodeError, ValueError) as exc:
+            raise ValueError(f"Invalid portfolio for tenant {tenant!r}: {exc}") from exc
+    return Portfolio(
+        tenant=tenant,
+        profile=data["profile"],
+        skills=data["skills"],
+        projects=[Project(**project) for project in data["projects"]],
+        timeline=build_timeline(data["courses"], data["education"], data["experience"]),
+        asset_root=tenant_dir(tenant),
+        assets=build_tenant_manifest(tenant, tenant_dir(tenant)),
+        mtime=mtime,
+    )
+
+
+def resolve_tenant(query_params: Mapping[str, str], headers: Mapping[str, str]) -> str:
+    """Pick the tenant id from ``?tenant=`` or the Host header's first label."""
+    candidates = [query_params.get("tenant")]
+    host = headers.get("Host") or headers.get("host")
+    if host:
+        candidates.append(host.split(":")[0].split(".")[0])
+    for candidate in candidates:
+        if not candidate:
+            continue
+        candidate = candidate.lower()
+        # The id becomes a path component, so only accept plain slugs
+        if _TENANT_ID.match(candidate) and os.path.isfile(portfolio_path(candidate)):
+            return candidate
+    return DEFAULT_TENANT
+
+
+class TenantRegistry:
+    """Process-wide LRU of loaded portfolios, reloaded when their files change.
+
+    A tenant's directory is rescanned at most once per ``check_interval``
+    seconds, so reruns do not walk it every time.
+    """
+
+    def __init__(
+        self, default: Portfolio, maxsize: int = MAX_TENANTS, check_interval: float = CHECK_INTERVAL
+    ):
+        self.default = default
+        self.check_interval = check_interval
+        self._cache: LRUCache[str, Portfolio] = LRUCache(maxsize)
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def get(self, tenant: str) -> Portfolio:
+        if tenant == DEFAULT_TENANT:
+            return self.default
+        portfolio = self._cache.get(tenant)
+        if not self._stale(tenant, portfolio):
+            return portfolio
+        # One load per tenant at a time; sessions that waited reuse its result
+        with self._load_lock(tenant):
+            portfolio = self._cache.get(tenant)
+            if self._stale(tenant, portfolio):
+                portfolio = load_portfolio(tenant)
+                portfolio.checked_at = time.monotonic()
+                self._cache.put(tenant, portfolio)
+            return portfolio
+
+    def _stale(self, tenant: str, portfolio: Optional[Portfolio]) -> bool:
+        if portfolio is None:
+            return True
+        now = time.monotonic()
+        if now - portfolio.checked_at < self.check_interval:
+            return False
+        try:
+            if tenant_mtime(tenant) != portfolio.mtime:
+                return True
+        except OSError:
+            return True
+        portfolio.checked_at = now
+        return False
+
+    def _load_lock(self, tenant: str) -> threading.Lock:
+        # Only ids with a tenant directory get here, so this stays small
+        with self._locks_lock:
+            return self._locks.setdefault(tenant, threading.Lock())
+
@@ -0,0 +1,102 @@
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+import inference
+from inference import BatchingExecutor
+
+
+def feature_count(X):
+    """Each row's prediction is its feature count; a batch size tags the call."""
+    return np.full(X.shape[0], X.shape[1]) * 1000 + X.shape[0]
+
+
+def wrong_length(X):
+    return np.zeros(X.shape[0] + 1)
+
+
+def crash_on_negative(X):
+    if (X < 0).any():
+        os._exit(1)
+    return X.sum(axis=1)
+
+
+@pytest.fixture
+def make_executor():
+    executors = []
+
+    def make(fn, **kwargs):
+        executors.append(BatchingExecutor(fn, workers=1, **kwargs))
+        return executors[-1]
+
+    yield make
+    for executor in executors:
+        executor.shutdown()
+
+
+def test_concurrent_rows_are_batched(make_executor):
+    executor = make_executor(feature_count, max_wait_ms=200)
+    rows = [[i, i, i] for i in range(8)]
+    futures = [executor.submit(row) for row in rows]
+    results = [future.result(timeout=60) for future in futures]
+    # All eight rows were scored in one call with three features each
+    assert results == [3008] * 8
+
+
+def test_rows_are_grouped_by_feature_count(make_executor):
+    executor = make_executor(feature_count, max_wait_ms=200)
+    short = executor.submit([1, 2])
+    long = executor.submit([1, 2, 3])
+    assert short.result(timeout=60) == 2001
+    assert long.result(timeout=60) == 3001
+
+
+def test_length_mismatch_fails_the_batch(make_executor):
+    executor = make_executor(wrong_length)
+    with pytest.raises(ValueError, match="2 results for 1 rows"):
+        executor.predict([1.0], timeout=60)
+
+
+def test_pool_is_replaced_after_a_worker_dies(make_executor):
+    executor = make_executor(crash_on_negative)
+    with pytest.raises(BrokenProcessPool):
+        executor.predict([-1.0], timeout=60)
+    assert executor.predict([1.0, 2.0], timeout=60) == 3.0
+
+
+def test_predict_many_threads(make_executor):
+    executor = make_executor(feature_count, max_wait_ms=20)
+    results = []
+    lock = threading.Lock()
+
+    def worker(i):
+        value = executor.predict([i, i], timeout=60)
+        with lock:
+            results.append(value)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(32)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 32
+    assert all(value // 1000 == 2 for value in results)
+
+
+def test_service_is_replaced_when_the_function_is_reloaded(monkeypatch):
+    monkeypatch.setattr(inference, "_executors", {})
+    first = inference.inference_service(feature_count)
+    assert inference.inference_service(feature_count) is first
+
+    def feature_count_reloaded(X):
+        return feature_count(X)
+    feature_count_reloaded.__qualname__ = feature_count.__qualname__
+    feature_count_reloaded.__module__ = feature_count.__module__
+
+    second = inference.inference_service(feature_count_reloaded)
+    assert second is not first
+    assert first._closed
+    second.shutdown()
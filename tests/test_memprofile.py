@@ -0,0 +1,74 @@
+import logging
+import tracemalloc
+
+import pytest
+
+import memprofile
+from memprofile import MemoryProfiler
+
+_retained = []
+
+
+def render_leak():
+    _retained.append([object() for _ in range(2000)])
+
+
+def _reset_handlers():
+    logger = logging.getLogger("portfolio.memory")
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    was_tracing = tracemalloc.is_tracing()
+    _reset_handlers()
+    profiler = MemoryProfiler(str(tmp_path / "memory.log"), sample_every=2)
+    yield profiler
+    _reset_handlers()
+    _retained.clear()
+    if not was_tracing:
+        tracemalloc.stop()
+
+
+def test_only_every_nth_rerun_is_reported(profiler):
+    for _ in range(4):
+        with profiler.profile(lambda: "home", {}):
+            pass
+    assert profiler._reruns == 4
+    assert len(profiler._history["home"]) == 2
+
+
+def test_retained_memory_is_attributed_to_render_function(profiler, tmp_path):
+    reports = []
+    profiler._report = lambda route, before, after, spans: reports.append((route, before, after, spans))
+    page = {"name": "home"}
+
+    def run():
+        with profiler.profile(lambda: page["name"], {"render_leak": render_leak}):
+            render_leak()
+            page["name"] = "projects"
+
+    run()
+    run()
+    assert len(reports) == 1
+    route, before, after, spans = reports[0]
+    assert route == "projects"
+
+    del profiler._report
+    profiler._report(route, before, after, spans)
+    assert profiler.retained["projects"] > 0
+    log = (tmp_path / "memory.log").read_text()
+    assert "render_leak: +" in log
+    assert memprofile.__file__ not in log
+    assert "test_memprofile.py:" in log
+
+
+def test_concurrent_sample_is_skipped(profiler):
+    profiler.sample_every = 1
+    with profiler.profile(lambda: "outer", {}):
+        with profiler.profile(lambda: "inner", {}):
+            pass
+    assert "inner" not in profiler._history
+    assert "outer" in profiler._history
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from static_assets import CACHE_CONTROL, ImmutableAssetsMiddleware
+
+
+def call(path, status=200, headers=(), scope_type="http"):
+    """Run the middleware around a fake app and return the messages it sends."""
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": status, "headers": list(headers)})
+        await send({"type": "http.response.body", "body": b"data"})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request"}
+
+    scope = {"type": scope_type, "path": path}
+    asyncio.run(ImmutableAssetsMiddleware(app)(scope, receive, send))
+    return sent
+
+
+def cache_control(messages):
+    start = messages[0]
+    return [value for name, value in start["headers"] if name.lower() == b"cache-control"]
+
+
+def test_fingerprinted_asset_is_immutable():
+    messages = call("/app/static/assets/profile.0123456789ab.jpg")
+    assert cache_control(messages) == [CACHE_CONTROL.encode()]
+    assert messages[1] == {"type": "http.response.body", "body": b"data"}
+
+
+def test_existing_cache_control_is_replaced():
+    messages = call(
+        "/app/static/assets/_tenants/alice/me.0123456789ab.jpg",
+        headers=[(b"Cache-Control", b"no-cache"), (b"content-type", b"image/jpeg")],
+    )
+    assert cache_control(messages) == [CACHE_CONTROL.encode()]
+    assert (b"content-type", b"image/jpeg") in messages[0]["headers"]
+
+
+@pytest.mark.parametrize("path, status", [
+    ("/app/static/assets/missing.jpg", 404),
+    ("/app/static/other.css", 200),
+    ("/_stcore/health", 200),
+    ("/", 200),
+])
+def test_other_responses_pass_through(path, status):
+    headers = [(b"content-type", b"text/plain")]
+    messages = call(path, status=status, headers=headers)
+    assert messages[0] == {"type": "http.response.start", "status": status, "headers": headers}
+
+
+def test_non_http_scopes_pass_through():
+    messages = call("/app/static/assets/profile.jpg", scope_type="websocket")
+    assert cache_control(messages) == []
@@ -0,0 +1,202 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import static_assets
+import tenants
+from content import Project
+from tenants import LRUCache, TenantRegistry, load_portfolio, resolve_tenant
+from timeline import TimelineIndex
+from warmstart import render_fragments, safe_url
+
+
+@pytest.fixture
+def tenant_tree(tmp_path, monkeypatch):
+    """A tenants/ directory and static namespace rooted in tmp_path."""
+    static_dir = tmp_path / "static" / "assets"
+    monkeypatch.setattr(tenants, "TENANTS_DIR", str(tmp_path / "tenants"))
+    monkeypatch.setattr(static_assets, "STATIC_DIR", str(static_dir))
+    monkeypatch.setattr(static_assets, "TENANT_STATIC_DIR", str(static_dir / "_tenants"))
+
+    def make(tenant, portfolio, files=()):
+        root = tmp_path / "tenants" / tenant
+        root.mkdir(parents=True)
+        (root / "portfolio.json").write_text(json.dumps(portfolio), encoding="utf-8")
+        for name in files:
+            (root / name).write_bytes(name.encode())
+        return root
+
+    return make
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get_or_create("d", lambda: 4) == 4
+    assert len(cache) == 2
+
+
+def test_resolve_tenant(tenant_tree):
+    tenant_tree("alice", {"profile": {"name": "Alice"}})
+    assert resolve_tenant({"tenant": "alice"}, {}) == "alice"
+    assert resolve_tenant({}, {"Host": "Alice.example.com:8501"}) == "alice"
+    assert resolve_tenant({"tenant": "../alice"}, {}) == "default"
+    assert resolve_tenant({"tenant": "bob"}, {"host": "localhost"}) == "default"
+
+
+def test_tenant_assets_are_published_and_confined(tenant_tree):
+    tenant_tree("alice", {"profile": {"name": "Alice", "photo": "me.jpg"}}, files=["me.jpg"])
+    portfolio = load_portfolio("alice")
+
+    url = portfolio.asset_url(portfolio.profile["photo"])
+    assert url.startswith("app/static/assets/_tenants/alice/me.")
+    assert "portfolio.json" not in portfolio.assets
+    assert portfolio.asset_url("../../assets/Sunny_Solomon_Resume.pdf", "fallback") == "fallback"
+    assert portfolio.asset_url("assets/Sunny_Solomon_Resume.pdf", "fallback") == "fallback"
+    assert portfolio.asset_url("https://example.com/me.png") == "https://example.com/me.png"
+    assert portfolio.asset_url("javascript:alert(1)", "fallback") == "fallback"
+
+
+def test_default_manifest_keeps_tenant_namespaces(tenant_tree, tmp_path):
+    tenant_tree("alice", {}, files=["me.jpg"])
+    load_portfolio("alice")
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "logo.png").write_bytes(b"logo")
+
+    manifest = static_assets.build_manifest(str(assets), static_assets.STATIC_DIR)
+    assert list(manifest) == ["assets/logo.png"]
+    assert os.listdir(os.path.join(static_assets.TENANT_STATIC_DIR, "alice"))
+
+
+def test_registry_reloads_when_tenant_files_change(tenant_tree):
+    root = tenant_tree("alice", {"profile": {"name": "Alice"}})
+    registry = TenantRegistry(default=None, maxsize=4, check_interval=60)
+    first = registry.get("alice")
+    assert registry.get("alice") is first
+
+    (root / "portfolio.json").write_text(json.dumps({"profile": {"name": "Alicia"}}))
+    os.utime(root / "portfolio.json", (first.mtime + 10, first.mtime + 10))
+    # Not rescanned until the check interval has passed
+    assert registry.get("alice") is first
+    first.checked_at -= 60
+    assert registry.get("alice").profile["name"] == "Alicia"
+
+
+def test_registry_does_not_rescan_within_interval(tenant_tree, monkeypatch):
+    tenant_tree("alice", {})
+    registry = TenantRegistry(default=None, check_interval=60)
+    registry.get("alice")
+    scans = []
+    monkeypatch.setattr(tenants, "tenant_mtime", lambda tenant: scans.append(tenant))
+    for _ in range(10):
+        registry.get("alice")
+    assert scans == []
+
+
+@pytest.mark.parametrize("portfolio, problem", [
+    ([], "portfolio must be an object"),
+    ({"projects": [{"title": "Missing fields"}]}, "projects[0] is missing 'subtitle'"),
+    ({"courses": [{"name": "ML", "status": "Done", "year": "2024"}]}, "courses[0] is missing 'provider'"),
+    (
+        {"education": [{"degree": "BSc", "period": "2019 - 2022", "details": ""}]},
+        "education[0] is missing 'institution'",
+    ),
+    (
+        {"experience": [{"title": "Dev", "company": "Acme", "period": "2020"}]},
+        "experience[0] is missing 'responsibilities'",
+    ),
+    (
+        {"experience": [{"title": "Dev", "company": "Acme", "period": "2020", "responsibilities": "x"}]},
+        "experience[0].responsibilities must be a list of strings",
+    ),
+    ({"skills": ["Python"]}, "skills must be an object"),
+    ({"skills": {"Tech": [1]}}, "skills['Tech'] must be a list of strings"),
+    ({"profile": {"name": 42}}, "profile.name must be a str"),
+    ({"profile": {"focus": "ML"}}, "profile.focus must be a list of strings"),
+])
+def test_invalid_portfolio_raises_value_error(tenant_tree, portfolio, problem):
+    tenant_tree("alice", portfolio)
+    with pytest.raises(ValueError, match="alice") as info:
+        load_portfolio("alice")
+    assert problem in str(info.value)
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://github.com/alice", "https://github.com/alice"),
+    ("mailto:a@example.com", "mailto:a@example.com"),
+    ("#demo", "#demo"),
+    ('https://x.com/"onmouseover="1', "https://x.com/&quot;onmouseover=&quot;1"),
+    ("javascript:alert(1)", None),
+    (" JavaScript:alert(1)", None),
+    ("data:text/html,<b>", None),
+])
+def test_safe_url(url, expected):
+    assert safe_url(url) == expected
+
+
+def test_fragments_escape_tenant_text():
+    project = Project(
+        title="t", subtitle="s", description="d", deliverables=[],
+        tools=["<script>x</script>"],
+        links={"<b>Site</b>": "https://example.com", "Bad": "javascript:alert(1)"},
+        tags=["<img src=x onerror=alert(1)>"],
+    )
+    fragments = render_fragments(project)
+    assert "<img" not in fragments.tags and "&lt;img" in fragments.tags
+    assert fragments.tools == ['<div class="tech-item">&lt;script&gt;x&lt;/script&gt;</div>']
+    assert "&lt;b&gt;Site&lt;/b&gt;" in fragments.links
+    assert "javascript" not in fragments.links
+
+
+def test_portfolio_defaults_to_empty_timeline(tenant_tree):
+    tenant_tree("alice", {})
+    assert isinstance(load_portfolio("alice").timeline, TimelineIndex)
+
+
+def test_fragments_are_cached_per_project_not_per_title(tenant_tree):
+    project = {"title": "Same", "subtitle": "", "description": "", "deliverables": [], "links": {}}
+    tenant_tree("alice", {"projects": [
+        {**project, "tools": ["Python"], "tags": ["first"]},
+        {**project, "tools": ["Rust"], "tags": ["second"]},
+    ]})
+    portfolio = load_portfolio("alice")
+    first, second = (portfolio.project_fragments(i, p) for i, p in enumerate(portfolio.projects))
+    assert "first" in first.tags and "second" in second.tags
+
+
+def test_concurrent_cold_loads_share_one_publish(tenant_tree, monkeypatch):
+    tenant_tree("alice", {"profile": {"photo": "me.jpg"}}, files=["me.jpg"])
+    loads = []
+    real_load = tenants.load_portfolio
+
+    def slow_load(tenant):
+        loads.append(tenant)
+        time.sleep(0.05)
+        return real_load(tenant)
+
+    monkeypatch.setattr(tenants, "load_portfolio", slow_load)
+    registry = TenantRegistry(default=None)
+    with ThreadPoolExecutor(4) as pool:
+        portfolios = list(pool.map(registry.get, ["alice"] * 8))
+    assert loads == ["alice"]
+    assert all(portfolio is portfolios[0] for portfolio in portfolios)
+
+
+def test_publish_tolerates_concurrent_writers(tmp_path):
+    src = tmp_path / "big.bin"
+    src.write_bytes(os.urandom(1 << 20))
+    dest = tmp_path / "out" / "big.0123.bin"
+    dest.parent.mkdir()
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(lambda _: static_assets._publish(str(src), str(dest)), range(8)))
+    assert dest.read_bytes() == src.read_bytes()
+    assert os.listdir(dest.parent) == [dest.name]
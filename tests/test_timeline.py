@@ -0,0 +1,98 @@
+import datetime
+import random
+
+import pytest
+
+import timeline
+from timeline import DateRange, TimelineEntry, TimelineIndex, build_timeline, parse_period
+
+D = datetime.date
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Sep 2022 – May 2023", DateRange(D(2022, 9, 1), D(2023, 5, 31))),
+    ("2019 - 2022", DateRange(D(2019, 1, 1), D(2022, 12, 31))),
+    ("Till 2017", DateRange(D(2017, 1, 1), D(2017, 12, 31))),
+    ("2024", DateRange(D(2024, 1, 1), D(2024, 12, 31))),
+    ("September 2020 to Feb 2021", DateRange(D(2020, 9, 1), D(2021, 2, 28))),
+])
+def test_parse_period(text, expected):
+    assert parse_period(text) == expected
+
+
+@pytest.mark.parametrize("text", ["Summer 2020", "2019 – 2021 (part-time)", "2023 - 2021", ""])
+def test_parse_period_rejects_unreadable_text(text):
+    with pytest.raises(ValueError):
+        parse_period(text)
+
+
+def test_open_ended_periods_resolve_at_query_time(monkeypatch):
+    period = parse_period("Jan 2024 – Present")
+    assert period == DateRange(D(2024, 1, 1), None)
+    index = build_timeline(experience=[{"title": "Analyst", "period": "Jan 2024 – Present"}])
+
+    monkeypatch.setattr(timeline, "_today", lambda: D(2025, 6, 1))
+    assert index.span == DateRange(D(2024, 1, 1), D(2025, 6, 1))
+    assert index.overlapping("2026") == []
+    assert [e.label for e in index.within("2024 - 2025")] == ["Analyst"]
+
+    # The same index, a year later, without rebuilding
+    monkeypatch.setattr(timeline, "_today", lambda: D(2026, 6, 1))
+    assert index.span.end == D(2026, 6, 1)
+    assert [e.label for e in index.overlapping("2026")] == ["Analyst"]
+    assert index.within("2024 - 2025") == []
+
+
+def test_unparseable_periods_are_listed_but_undated():
+    index = build_timeline(
+        education=[{"degree": "B.Sc.", "period": "2019 - 2022"}],
+        experience=[{"title": "Intern", "period": "Summer 2020"}],
+    )
+    assert [e.label for e in index.chronological()] == ["B.Sc.", "Intern"]
+    assert [e.label for e in index.undated] == ["Intern"]
+    assert [e.label for e in index.overlapping("2020")] == ["B.Sc."]
+    assert [e.label for e in index.of_kind("experience")] == ["Intern"]
+
+
+def test_queries_on_sample_history():
+    index = build_timeline(
+        courses=[{"name": "ML", "year": "2024"}],
+        education=[
+            {"degree": "B.Sc.", "period": "2019 - 2022"},
+            {"degree": "10th", "period": "Till 2017"},
+        ],
+        experience=[{"title": "Associate", "period": "Sep 2022 – May 2023"}],
+    )
+    assert [e.label for e in index.overlapping("2022 - 2023")] == ["B.Sc.", "Associate"]
+    assert [e.label for e in index.within("2017 - 2023")] == ["10th", "B.Sc.", "Associate"]
+    assert index.span == DateRange(D(2017, 1, 1), D(2024, 12, 31))
+    assert [e.label for e in index.of_kind("education")] == ["10th", "B.Sc."]
+    assert index.overlapping("2030") == []
+
+
+def test_queries_match_brute_force():
+    rng = random.Random(0)
+    entries = []
+    for i in range(2000):
+        start = D(1990, 1, 1) + datetime.timedelta(days=rng.randrange(12000))
+        # Mostly short entries plus a few that span decades
+        length = rng.randrange(20000) if i % 100 == 0 else rng.randrange(900)
+        end = None if i % 50 == 1 else start + datetime.timedelta(days=length)
+        entries.append(TimelineEntry("experience", f"e{i}", DateRange(start, end)))
+    index = TimelineIndex(entries)
+
+    for _ in range(200):
+        start = D(1988, 1, 1) + datetime.timedelta(days=rng.randrange(16000))
+        query = DateRange(start, start + datetime.timedelta(days=rng.randrange(2000)))
+        assert set(index.overlapping(query)) == {e for e in entries if e.period.overlaps(query)}
+        assert set(index.within(query)) == {e for e in entries if query.contains(e.period)}
+        overlapping = index.overlapping(query)
+        assert overlapping == sorted(overlapping, key=timeline._sort_key)
+
+
+def test_empty_index():
+    index = TimelineIndex([])
+    assert len(index) == 0
+    assert index.span is None
+    assert index.overlapping("2020") == []
+    assert index.within("2020") == []
@@ -0,0 +1,101 @@
+import dataclasses
+import functools
+import os
+import shutil
+
+import pytest
+
+import static_assets
+import warmstart
+from warmstart import load_state, save_state
+
+
+@pytest.fixture
+def warm_tree(tmp_path, monkeypatch):
+    """Copies of the sources plus assets/ and static/ rooted in tmp_path.
+
+    Returns a list that records every full rebuild.
+    """
+    src = tmp_path / "src"
+    src.mkdir()
+    for name in warmstart.SOURCES:
+        shutil.copy(os.path.join(static_assets.BASE_DIR, name), src / name)
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    (assets / "logo.png").write_bytes(b"logo")
+    static_dir = tmp_path / "static" / "assets"
+
+    monkeypatch.setattr(warmstart, "ASSETS_DIR", str(assets))
+    monkeypatch.setattr(warmstart, "STATIC_DIR", str(static_dir))
+    monkeypatch.setattr(warmstart, "source_hash", functools.partial(warmstart.source_hash, str(src)))
+    monkeypatch.setattr(
+        warmstart, "build_manifest",
+        functools.partial(static_assets.build_manifest, str(assets), str(static_dir)),
+    )
+    builds = []
+    real_build = warmstart.build_state
+
+    def build_state():
+        builds.append(1)
+        return real_build()
+
+    monkeypatch.setattr(warmstart, "build_state", build_state)
+    return builds
+
+
+@pytest.fixture
+def artifact(tmp_path, warm_tree):
+    path = str(tmp_path / "build" / "warmstart.pkl")
+    save_state(warmstart.build_state(), path)
+    warm_tree.clear()
+    return path
+
+
+def test_fresh_artifact_is_loaded(artifact, warm_tree):
+    state = load_state(artifact)
+    assert warm_tree == []
+    assert list(state.assets) == ["assets/logo.png"]
+    assert len(state.fragments) == len(state.projects)
+
+
+def test_source_change_rebuilds(artifact, warm_tree, tmp_path):
+    with open(tmp_path / "src" / "content.py", "a") as f:
+        f.write("\n# edited\n")
+    load_state(artifact)
+    assert warm_tree == [1]
+
+
+def test_asset_change_rebuilds(artifact, warm_tree, tmp_path):
+    (tmp_path / "assets" / "logo.png").write_bytes(b"new logo")
+    state = load_state(artifact)
+    assert warm_tree == [1]
+    assert state.assets["assets/logo.png"].endswith(
+        f".{static_assets.fingerprint(str(tmp_path / 'assets' / 'logo.png'))}.png"
+    )
+
+
+def test_missing_published_copy_rebuilds(artifact, warm_tree, tmp_path):
+    static_dir = tmp_path / "static" / "assets"
+    for name in os.listdir(static_dir):
+        os.remove(static_dir / name)
+    state = load_state(artifact)
+    assert warm_tree == [1]
+    assert warmstart._published(state.assets)
+
+
+@pytest.mark.parametrize("contents", [b"", b"not a pickle", None])
+def test_unreadable_artifact_rebuilds(artifact, warm_tree, contents):
+    if contents is None:
+        os.remove(artifact)
+    else:
+        with open(artifact, "wb") as f:
+            f.write(contents)
+    load_state(artifact)
+    assert warm_tree == [1]
+
+
+def test_old_artifact_version_rebuilds(artifact, warm_tree):
+    state = load_state(artifact)
+    save_state(dataclasses.replace(state, version=warmstart.ARTIFACT_VERSION - 1), artifact)
+    load_state(artifact)
+    assert warm_tree == [1]
@@ -0,0 +1,224 @@
+# timeline.py
+
+import calendar
+import datetime
+import logging
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+MONTHS = {name.lower(): idx for idx, name in enumerate(calendar.month_abbr) if name}
+_PART = re.compile(r"^(?:(?P<month>[A-Za-z]{3})[a-z]*\.?\s+)?(?P<year>\d{4})$")
+_SEPARATOR = re.compile(r"\s*(?:-|–|—|\bto\b)\s*")
+_OPEN_END = {"present", "now", "current", "ongoing"}
+
+logger = logging.getLogger(__name__)
+
+
+# Stands in for the end of ongoing entries inside the index
+_OPEN_ORDINAL = datetime.date.max.toordinal()
+
+
+def _today() -> datetime.date:
+    return datetime.date.today()
+
+
+@dataclass(frozen=True)
+class DateRange:
+    """Inclusive range of calendar days.
+
+    ``end`` is None for ongoing periods ("Jan 2024 – Present"); it is resolved
+    to today only when queried, so a parsed range never goes stale.
+    """
+    start: datetime.date
+    end: Optional[datetime.date]
+
+    def resolve(self, today: Optional[datetime.date] = None) -> "DateRange":
+        if self.end is not None:
+            return self
+        return DateRange(self.start, max(self.start, today or _today()))
+
+    def overlaps(self, other: "DateRange") -> bool:
+        a, b = self.resolve(), other.resolve()
+        return a.start <= b.end and b.start <= a.end
+
+    def contains(self, other: "DateRange") -> bool:
+        a, b = self.resolve(), other.resolve()
+        return a.start <= b.start and b.end <= a.end
+
+
+def _parse_part(text: str, is_end: bool) -> datetime.date:
+    match = _PART.match(text.strip())
+    if not match:
+        raise ValueError(f"Unrecognised date: {text!r}")
+    year = int(match.group("year"))
+    month = match.group("month")
+    if month is None:
+        return datetime.date(year, 12, 31) if is_end else datetime.date(year, 1, 1)
+    try:
+        number = MONTHS[month.lower()]
+    except KeyError:
+        raise ValueError(f"Unrecognised month: {month!r}") from None
+    day = calendar.monthrange(year, number)[1] if is_end else 1
+    return datetime.date(year, number, day)
+
+
+def parse_period(text: str) -> DateRange:
+    """Parse free-text periods such as "Sep 2022 – May 2023", "2019 - 2022",
+    "Till 2017", "2024" or "Jan 2024 – Present" into a DateRange."""
+    text = text.strip()
+    if text.lower().startswith("till "):
+        # Only the end is known; treat it as that final year/month
+        end = _parse_part(text[5:], is_end=True)
+        start = _parse_part(text[5:], is_end=False)
+        return DateRange(start, end)
+
+    parts = _SEPARATOR.split(text, maxsplit=1)
+    start = _parse_part(parts[0], is_end=False)
+    if len(parts) == 1:
+        return DateRange(start, _parse_part(parts[0], is_end=True))
+    if parts[1].strip().lower() in _OPEN_END:
+        return DateRange(start, None)
+    end = _parse_part(parts[1], is_end=True)
+    if end < start:
+        raise ValueError(f"Period ends before it starts: {text!r}")
+    return DateRange(start, end)
+
+
+@dataclass(frozen=True)
+class TimelineEntry:
+    kind: str
+    label: str
+    # None when the period text could not be parsed; such entries are listed
+    # but never match a date query
+    period: Optional[DateRange]
+    data: dict = field(default_factory=dict, compare=False, hash=False)
+
+
+class TimelineIndex:
+    """Dated entries sorted by start date, backed by parallel ordinal arrays.
+
+    Containment queries bisect the start array. Overlap queries walk a
+    max-end segment tree over the same order, pruning every subtree whose
+    latest end falls before the query, so a single very long entry does not
+    widen the scan for everyone else.
+    """
+
+    def __init__(self, entries: Iterable[TimelineEntry]):
+        entries = list(entries)
+        self._entries: List[TimelineEntry] = sorted(
+            (e for e in entries if e.period is not None), key=_sort_key
+        )
+        self._undated: List[TimelineEntry] = [e for e in entries if e.period is None]
+        self._starts = array("l", (e.period.start.toordinal() for e in self._entries))
+        self._ends = array("l", (
+            _OPEN_ORDINAL if e.period.end is None else e.period.end.toordinal()
+            for e in self._entries
+        ))
+        self._open = [i for i, end in enumerate(self._ends) if end == _OPEN_ORDINAL]
+        self._max_closed_end = max((end for end in self._ends if end != _OPEN_ORDINAL), default=0)
+        self._size = 1
+        while self._size < len(self._entries):
+            self._size *= 2
+        self._max_end = array("l", [0]) * (2 * self._size)
+        self._max_end[self._size:self._size + len(self._ends)] = self._ends
+        for node in range(self._size - 1, 0, -1):
+            self._max_end[node] = max(self._max_end[2 * node], self._max_end[2 * node + 1])
+        self._by_kind: Dict[str, "TimelineIndex"] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._undated)
+
+    def __iter__(self) -> Iterator[TimelineEntry]:
+        return iter(self.chronological())
+
+    @property
+    def undated(self) -> List[TimelineEntry]:
+        return list(self._undated)
+
+    @property
+    def span(self) -> Optional[DateRange]:
+        if not self._entries:
+            return None
+        today = _today().toordinal()
+        end = max([self._max_closed_end] + [max(self._starts[i], today) for i in self._open])
+        return DateRange(datetime.date.fromordinal(self._starts[0]), datetime.date.fromordinal(end))
+
+    def of_kind(self, kind: str) -> "TimelineIndex":
+        """Sub-index holding only entries of ``kind``, built once and reused."""
+        if kind not in self._by_kind:
+            self._by_kind[kind] = TimelineIndex(e for e in self.chronological() if e.kind == kind)
+        return self._by_kind[kind]
+
+    def chronological(self, reverse: bool = False) -> List[TimelineEntry]:
+        """Dated entries in order, followed by undated ones as given."""
+        dated = self._entries[::-1] if reverse else self._entries
+        return dated + self._undated
+
+    def overlapping(self, query: Union[str, DateRange]) -> List[TimelineEntry]:
+        """Dated entries that share at least one day with ``query``."""
+        query = _as_range(query)
+        lo_ord = query.start.toordinal()
+        hi = bisect_right(self._starts, query.end.toordinal())
+        today = _today().toordinal()
+        found = []
+        # Depth-first over nodes covering [0, hi), left before right so the
+        # result stays in start order
+        stack = [(1, 0, self._size)] if hi else []
+        while stack:
+            node, node_lo, node_hi = stack.pop()
+            if node_lo >= hi or self._max_end[node] < lo_ord:
+                continue
+            if node >= self._size:
+                if self._resolved_end(node_lo, today) >= lo_ord:
+                    found.append(self._entries[node_lo])
+                continue
+            mid = (node_lo + node_hi) // 2
+            stack.append((2 * node + 1, mid, node_hi))
+            stack.append((2 * node, node_lo, mid))
+        return found
+
+    def within(self, query: Union[str, DateRange]) -> List[TimelineEntry]:
+        """Dated entries that lie entirely inside ``query``."""
+        query = _as_range(query)
+        hi_ord = query.end.toordinal()
+        lo = bisect_left(self._starts, query.start.toordinal())
+        hi = bisect_right(self._starts, hi_ord)
+        today = _today().toordinal()
+        return [self._entries[i] for i in range(lo, hi) if self._resolved_end(i, today) <= hi_ord]
+
+    def _resolved_end(self, i: int, today: int) -> int:
+        end = self._ends[i]
+        return max(self._starts[i], today) if end == _OPEN_ORDINAL else end
+
+
+def _sort_key(entry: TimelineEntry):
+    period = entry.period
+    return (period.start, period.end or datetime.date.max, entry.label)
+
+
+def _as_range(query: Union[str, DateRange]) -> DateRange:
+    return (parse_period(query) if isinstance(query, str) else query).resolve()
+
+
+def _entry(kind: str, label: str, period: str, data: dict) -> TimelineEntry:
+    try:
+        parsed = parse_period(period)
+    except ValueError:
+        logger.warning("Unparseable %s period %r for %r; listing it undated", kind, period, label)
+        parsed = None
+    return TimelineEntry(kind, label, parsed, data)
+
+
+def build_timeline(
+    courses: Sequence[dict] = (),
+    education: Sequence[dict] = (),
+    experience: Sequence[dict] = (),
+) -> TimelineIndex:
+    """Parse each section's periods once and merge them into a single index."""
+    entries = [_entry("course", c["name"], c["year"], c) for c in courses]
+    entries += [_entry("education", e["degree"], e["period"], e) for e in education]
+    entries += [_entry("experience", e["title"], e["period"], e) for e in experience]
+    return TimelineIndex(entries)
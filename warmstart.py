@@ -0,0 +1,134 @@
+# warmstart.py
+"""Precompile the app's derived state into a single warm-start artifact.
+
+Run ``python build_warmstart.py`` at build time (e.g. in the container image) to
+write ``build/warmstart.pkl``. At boot app.py loads it instead of rebuilding
+projects, fragments, CSS, the asset manifest and the timeline index on the
+first visitor's rerun. The artifact records a hash of every input file; if
+any of them changed it is ignored and the state is rebuilt lazily.
+"""
+
+import hashlib
+import html
+import os
+import pickle
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from content import COURSES, EDUCATION, EXPERIENCE, PROJECTS, Project
+from static_assets import ASSETS_DIR, BASE_DIR, STATIC_DIR, STATIC_URL, build_manifest
+from styles import CSS
+from timeline import TimelineIndex, build_timeline
+
+ARTIFACT_VERSION = 4
+ARTIFACT_PATH = os.path.join(BASE_DIR, "build", "warmstart.pkl")
+# Python sources whose output ends up in the artifact
+SOURCES = ["content.py", "styles.py", "static_assets.py", "timeline.py", "warmstart.py"]
+
+
+@dataclass
+class ProjectFragments:
+    """Pre-rendered HTML for the static parts of a project card."""
+    tags: str
+    tools: List[str]
+    links: str
+
+
+@dataclass
+class WarmState:
+    version: int
+    source_hash: str
+    css: str
+    projects: List[Project]
+    # Parallel to ``projects``; titles are not guaranteed unique
+    fragments: List[ProjectFragments]
+    assets: Dict[str, str]
+    timeline: TimelineIndex
+    built_at: float = field(default_factory=time.time)
+
+
+def source_hash(base_dir: str = BASE_DIR) -> str:
+    """Hash the Python sources and every file under assets/."""
+    digest = hashlib.sha256(str(ARTIFACT_VERSION).encode())
+    paths = [os.path.join(base_dir, name) for name in SOURCES]
+    for root, _, files in os.walk(ASSETS_DIR):
+        paths.extend(os.path.join(root, name) for name in files)
+    for path in sorted(paths):
+        digest.update(os.path.relpath(path, base_dir).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def safe_url(url: str) -> Optional[str]:
+    """HTML-escaped ``url`` if it is http(s), mailto or an in-page anchor, else None."""
+    url = url.strip()
+    scheme = urlsplit(url).scheme.lower()
+    if scheme in ("http", "https", "mailto") or (not scheme and url.startswith("#")):
+        return html.escape(url, quote=True)
+    return None
+
+
+def render_fragments(project: Project) -> ProjectFragments:
+    """Render card HTML, escaping text and dropping links with unsafe schemes."""
+    links = ((html.escape(label), safe_url(url)) for label, url in project.links.items())
+    return ProjectFragments(
+        tags="".join(f'<span class="project-tag">{html.escape(tag)}</span>' for tag in project.tags),
+        tools=[f'<div class="tech-item">{html.escape(tool)}</div>' for tool in project.tools],
+        links="".join(
+            f'<a href="{url}" target="_blank" class="action-btn">{label}</a>'
+            for label, url in links if url
+        ),
+    )
+
+
+def build_state() -> WarmState:
+    """Compute all derived state from scratch."""
+    return WarmState(
+        version=ARTIFACT_VERSION,
+        source_hash=source_hash(),
+        css=CSS,
+        projects=list(PROJECTS),
+        fragments=[render_fragments(project) for project in PROJECTS],
+        assets=build_manifest(),
+        timeline=build_timeline(COURSES, EDUCATION, EXPERIENCE),
+    )
+
+
+def save_state(state: WarmState, path: str = ARTIFACT_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+
+
+def _published(assets: Dict[str, str]) -> bool:
+    """Check the fingerprinted copies the manifest points at are on disk."""
+    prefix = f"{STATIC_URL}/"
+    return all(
+        os.path.exists(os.path.join(STATIC_DIR, *url[len(prefix):].split("/")))
+        for url in assets.values()
+    )
+
+
+def load_state(path: str = ARTIFACT_PATH) -> WarmState:
+    """Load the artifact if it matches the current tree, else rebuild lazily."""
+    state: Optional[WarmState] = None
+    try:
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, AttributeError, EOFError, ImportError):
+        state = None
+
+    if (
+        isinstance(state, WarmState)
+        and state.version == ARTIFACT_VERSION
+        and state.source_hash == source_hash()
+        and _published(state.assets)
+    ):
+        return state
+    return build_state()
+